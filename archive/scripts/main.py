@@ -1,11 +1,13 @@
 # main.py — local runner with Postgres rule packs + doc-type detection + optional concurrency
 from __future__ import annotations
 
-import os, re, json, time, hashlib, logging, shutil, sys, argparse
+import os, re, json, hashlib, logging, logging.handlers, multiprocessing, shutil, sys, argparse
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
 from telemetry import go_quiet
 import langextract as lx
+import orjson
 import pydantic
 from ingest import ingest
 from llm_factory import load_provider
@@ -38,12 +40,37 @@ print(f"[boot] Stdout encoding: {sys.stdout.encoding}")
 # ------------------------------
 go_quiet()
 
+# ------------------------------
+# Logging (queue-based so workers never block on stderr)  # [ADDED]
+# ------------------------------
+log = logging.getLogger("contractextract.runner")
+
+def _route_logs_to(log_queue) -> None:
+    """Send this process's runner records through log_queue; the parent's listener does the I/O."""
+    # go_quiet() makes "contractextract" non-propagating with its own stdout
+    # handler, so records never reach root: the queue handler goes on the
+    # runner logger itself. DEBUG keeps the stats/chunking lines the old
+    # print()s always showed.
+    log.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+
+def _start_log_listener():
+    log_queue = multiprocessing.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    _route_logs_to(log_queue)
+    listener.start()
+    return log_queue, listener
+
 # ------------------------------
 # Tunables (env)  # [ADDED]
 # ------------------------------
 MAX_CHAR_BUFFER = int(os.getenv("CE_MAX_CHAR_BUFFER", "1500"))         # for provider.extract
 MAX_WORKERS_EXTRACT = int(os.getenv("CE_MAX_WORKERS_EXTRACT", "1"))    # per-call extract workers
 CHUNK_TARGET = int(os.getenv("CE_CHUNK_TARGET", "9000"))               # [ADDED] chunk target size (chars)
+WRITE_HTML = os.getenv("CE_WRITE_HTML", "0") == "1"                    # [ADDED] render review.html per doc
 
 # ------------------------------
 # Path & write guards
@@ -55,9 +82,11 @@ def ensure_file_path_is_clear(out_dir: Path):
         shutil.rmtree(data_path)
     return data_path
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 def safe_out_dir(outputs_dir: Path, raw_name: str) -> Path:
-    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", raw_name)[:50]
-    h = hashlib.sha1(raw_name.encode("utf-8")).hexdigest()[:8]
+    stem = _SLUG_RE.sub("_", raw_name)[:50]
+    h = hashlib.blake2b(raw_name.encode("utf-8"), digest_size=4).hexdigest()
     return outputs_dir / f"{stem}-{h}"
 
 # ---------- helpers to coerce entities → extraction-like dicts  # [ADDED]
@@ -66,10 +95,10 @@ def _entity_to_extraction_dict(ent) -> dict:
     Try to robustly map an 'entity' (object or dict) into an extraction-like dict:
     {label, span, attributes}
     """
-    if hasattr(ent, "to_dict"):
-        d = ent.to_dict()
-    elif isinstance(ent, dict):
+    if isinstance(ent, dict):
         d = ent
+    elif hasattr(ent, "to_dict"):
+        d = ent.to_dict()
     else:
         # last-ditch introspection
         d = {
@@ -92,48 +121,47 @@ def _doc_has_any_extractions_or_entities(doc) -> bool:  # [ADDED]
 
 def has_extractions(result) -> bool:
     try:
-        # support both object-with-attr and dict-with-key  # [CHANGED]
-        docs = _to_docs(result)
-        if not docs:
-            # also consider top-level entities-only shape
-            if isinstance(result, dict) and result.get("entities"):
-                return True
-            if getattr(result, "entities", None):
-                return True
-            return False
-        # each doc can be an object or dict; look for extractions OR entities  # [CHANGED]
-        for d in docs:
-            if _doc_has_any_extractions_or_entities(d):
-                return True
-        return False
+        # support both object-with-attr and dict-with-key; stops at the first doc with hits  # [CHANGED]
+        if any(_doc_has_any_extractions_or_entities(d) for d in _to_docs(result)):
+            return True
+        # also consider top-level entities-only shape
+        if isinstance(result, dict):
+            return bool(result.get("entities"))
+        return bool(getattr(result, "entities", None))
     except Exception:
         return False
 
 # ------------------------------
 # Robust JSONL saver (UTF-8; handles corpus or single doc)
 # ------------------------------
-def _to_docs(result):  # [CHANGED]
+def _to_docs(result):  # [CHANGED] generator: callers stream docs instead of copying lists
     # Handle dict merges
     if isinstance(result, dict):
         if "documents" in result:
-            return list(result["documents"] or [])
+            yield from result["documents"] or ()
+            return
         # top-level entity-only payload → wrap into single doc
         if "entities" in result and result["entities"]:
-            return [{"text": result.get("text", ""), "entities": result["entities"]}]
+            yield {"text": result.get("text", ""), "entities": result["entities"]}
+            return
     # Objects with .documents
     if hasattr(result, "documents"):
-        return list(getattr(result, "documents") or [])
+        yield from getattr(result, "documents") or ()
+        return
     # Single AnnotatedDocument
     AD = getattr(lx.data, "AnnotatedDocument", None)
     if AD and isinstance(result, AD):
-        return [result]
+        yield result
+        return
     # Objects that expose top-level entities
     if getattr(result, "entities", None):
-        return [{"text": getattr(result, "text", ""), "entities": list(getattr(result, "entities"))}]
+        yield {"text": getattr(result, "text", ""), "entities": list(getattr(result, "entities"))}
+        return
     # Already a list
     if isinstance(result, (list, tuple)):
-        return list(result)
-    return []
+        yield from result
+
+_JSONL_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
 
 def save_jsonl_utf8(result, out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -148,63 +176,72 @@ def save_jsonl_utf8(result, out_dir: Path) -> Path:
         No .to_dict() calls (works across langextract versions).
         """
         if isinstance(dct_or_obj, dict):
-            d = dct_or_obj
+            get = dct_or_obj.get
         else:
-            d = {
-                "label": getattr(dct_or_obj, "label", None) or getattr(dct_or_obj, "type", None) or "entity",
-                "span": getattr(dct_or_obj, "span", None) or "",
-                "attributes": getattr(dct_or_obj, "attributes", None) or {},
-                "text": getattr(dct_or_obj, "text", None) or getattr(dct_or_obj, "value", None) or "",
-            }
-
-        label = d.get("label") or d.get("type") or "entity"
-        span = d.get("span", "")
-        attrs = d.get("attributes") or {}
-        txt = d.get("text") or d.get("value")
+            def get(name, _obj=dct_or_obj):
+                return getattr(_obj, name, None)
+
+        label = get("label") or get("type") or "entity"
+        span = get("span") or ""
+        attrs = get("attributes") or {}
+        txt = get("text") or get("value")
         if txt and "text" not in attrs:
-            attrs = {**attrs, "text": txt}
+            attrs["text"] = txt
         return {"label": label, "span": span, "attributes": attrs}
 
-    with open(path, "w", encoding="utf-8", errors="replace") as f:
+    def _doc_lines():
+        nonlocal count
         for d in docs:
-            # Obtain text and a list of extraction-like items (from either extractions or entities)
+            # Obtain text and normalized extraction dicts (from either extractions or entities)
             if isinstance(d, dict):
                 text_val = d.get("text", "")
-                ex_list = d.get("extractions")
-                if ex_list is None:
-                    ents = d.get("entities") or []
-                    ex_list = [_norm_extraction_dict(ent) for ent in ents]
-                else:
-                    ex_list = [_norm_extraction_dict(ex) for ex in (ex_list or [])]
+                raw = d.get("extractions")
+                if raw is None:
+                    raw = d.get("entities")
             else:
                 text_val = getattr(d, "text", "")
-                raw_extractions = getattr(d, "extractions", None)
-                if raw_extractions is not None:
-                    ex_list = [_norm_extraction_dict(e) for e in (raw_extractions or [])]
-                else:
-                    ents = getattr(d, "entities", None) or []
-                    ex_list = [_norm_extraction_dict(ent) for ent in ents]
-
-            # Ensure normalized dicts only
-            norm_ex = [_norm_extraction_dict(ex) for ex in (ex_list or [])]
-            doc_dict = {"text": text_val, "extractions": norm_ex}
-            f.write(json.dumps(doc_dict, ensure_ascii=False) + "\n")
+                raw = getattr(d, "extractions", None)
+                if raw is None:
+                    raw = getattr(d, "entities", None)
+
+            doc_dict = {"text": text_val, "extractions": [_norm_extraction_dict(ex) for ex in raw or ()]}
             count += 1
+            yield orjson.dumps(doc_dict, option=_JSONL_OPTS)
+
+    # One writelines call; lines are produced lazily so large results still stream
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.writelines(_doc_lines())
 
-    print(f"[INFO] Wrote {count} docs to {path}")
+    log.info("Wrote %d docs to %s", count, path)
     return path
 
 
 
+def write_review_html(result, out_dir: Path) -> None:
+    """
+    Render review.html with lx.visualize when CE_WRITE_HTML=1.
+    A single AnnotatedDocument is rendered from memory; merged results
+    go through the data.jsonl already written by save_jsonl_utf8.
+    """
+    if not WRITE_HTML:
+        return
+    try:
+        AD = getattr(lx.data, "AnnotatedDocument", None)
+        src = result if AD and isinstance(result, AD) else str(out_dir / "data.jsonl")
+        vis = lx.visualize(src)
+        with open(out_dir / "review.html", "w", encoding="utf-8", errors="replace") as f:
+            f.write(vis if isinstance(vis, str) else vis.data)
+    except Exception as viz_e:
+        (out_dir / "_viz_error.txt").write_text(str(viz_e), encoding="utf-8", errors="replace")
+
 # Small debug helper  # [ADDED]
 def print_doc_stats(tag: str, result):
-    docs = _to_docs(result)
-    n = len(docs)
-    k = 0
-    for d in docs:
+    n = k = 0
+    for d in _to_docs(result):
+        n += 1
         if _doc_has_any_extractions_or_entities(d):
             k += 1
-    print(f"[debug] {tag}: docs={n}, docs_with_extractions_or_entities={k}")
+    log.debug("%s: docs=%d, docs_with_extractions_or_entities=%d", tag, n, k)
 
 # ------------------------------
 # Simple sanity fallback (regex) if model returns nothing
@@ -259,90 +296,122 @@ def chunk_by_pages(text: str, target_size: int = 9000) -> list[str]:
     """
     Split on form-feed (\f) page breaks (preserved by ingest.py),
     merging adjacent pages up to ~target_size chars.
+    Chunks are single slices of the original text (page breaks kept),
+    so no intermediate strings are built while accumulating pages.
     """
-    pages = (text or "").split("\f")
-    if len(pages) <= 1:
+    text = text or ""
+    breaks = [m.start() for m in re.finditer("\f", text)]
+    if not breaks:
         return [text]
-    chunks, buf = [], ""
-    for p in pages:
-        nxt = (buf + "\n" + p) if buf else p
-        if len(nxt) <= target_size:
-            buf = nxt
-        else:
-            if buf:
-                chunks.append(buf)
-            buf = p
-    if buf:
-        chunks.append(buf)
-    return chunks
+    starts = [0] + [b + 1 for b in breaks]   # page i is text[starts[i]:ends[i]]
+    ends = breaks + [len(text)]
+    chunks, first = [], 0
+    for i in range(1, len(starts)):
+        if ends[i] - starts[first] > target_size:
+            chunks.append(text[starts[first]:ends[i - 1]])
+            first = i
+    chunks.append(text[starts[first]:ends[-1]])
+    return [c for c in chunks if c]
 
 def merge_extractions(results) -> dict:
     """
     Merge a list of per-chunk results into a single corpus-like dict
     that our saver/visualizer understands.
     """
-    docs = []
-    for r in results:
-        docs.extend(_to_docs(r))
-    return {"documents": docs}
+    return {"documents": list(chain.from_iterable(map(_to_docs, results)))}
+
+# ------------------------------
+# Per-process worker state  # [ADDED]
+# ------------------------------
+_PROVIDER = None  # built once per process, reused for every document
+_PACKS: dict = {}  # pack_id -> RuntimeRulePack, shipped once per worker
+_LX_EXAMPLES: dict = {}  # pack_id -> list[lx.data.ExampleData], built once per pack
+
+def _get_provider():
+    global _PROVIDER
+    if _PROVIDER is None:
+        _PROVIDER = load_provider("llm.yaml")
+    return _PROVIDER
+
+def _load_packs(pack_dicts: dict) -> None:
+    """Rebuild RuntimeRulePacks and their LangExtract examples once per process."""
+    for pack_id, pack_dict in pack_dicts.items():
+        # works whether dict came from Pydantic .dict() or similar
+        pack = _PACKS[pack_id] = RuntimeRulePack.parse_obj(pack_dict)
+        _LX_EXAMPLES[pack_id] = _as_lx_examples(pack.examples)
+
+def _worker_init(pack_dicts=None, llm_override=None, log_queue=None):
+    """
+    ProcessPool initializer: build the provider and packs once per worker instead of
+    per submitted document, and carry the CLI LLM override and log queue into spawned workers.
+    """
+    if log_queue is not None:
+        _route_logs_to(log_queue)
+    if pack_dicts:
+        _load_packs(pack_dicts)
+    if llm_override is not None:
+        process_document._llm_override = llm_override
+    _get_provider()
 
 # ------------------------------
 # Per-document worker (safe for ProcessPool)
 # ------------------------------
-def process_document(name: str, text: str, pack_dict: dict, outputs_dir_str: str) -> tuple[str, str, str]:
+def process_document(name: str, text: str, pack_id: str, outputs_dir_str: str) -> tuple[str, str, str]:
     """
-    Reconstruct pack from dict, run local extraction + evaluation, save artifacts.
+    Look up the preloaded pack, run local extraction + evaluation, save artifacts.
     Returns (name, pack_id, out_dir_str).
     """
-    # Reconstruct RuntimeRulePack (works whether dict came from Pydantic .dict() or similar)
-    pack = RuntimeRulePack.parse_obj(pack_dict)
+    pack = _PACKS[pack_id]
 
-    # Local provider only (ollama or whatever llm.yaml says)
-    provider = load_provider("llm.yaml")
+    # Local provider only (ollama or whatever llm.yaml says); shared per process
+    provider = _get_provider()
 
     out_dir = safe_out_dir(Path(outputs_dir_str), name)
     ensure_file_path_is_clear(out_dir)
 
-    # Build examples for LangExtract
-    lx_examples = _as_lx_examples(pack.examples)
+    # Examples for LangExtract (prebuilt per pack in _load_packs)
+    lx_examples = _LX_EXAMPLES[pack_id]
 
     try:
-        # --- Page-chunking + per-chunk extract ---  # [ADDED]
+        # --- Page-chunking + batched extract ---  # [CHANGED]
         chunks = chunk_by_pages(text, target_size=CHUNK_TARGET)
-        print(f"[debug] chunking: {len(chunks)} chunk(s) (target={CHUNK_TARGET})")  # [ADDED]
-
-        chunk_results = []
-        for i, ch in enumerate(chunks, 1):
-            res = provider.extract(
-                text_or_documents=ch,
-                prompt=pack.prompt or "",
-                examples=lx_examples,
-                extraction_passes=1,
-                max_workers=MAX_WORKERS_EXTRACT,
-                max_char_buffer=MAX_CHAR_BUFFER,
+        log.debug("chunking: %d chunk(s) (target=%d)", len(chunks), CHUNK_TARGET)  # [ADDED]
+
+        extract_kwargs = dict(
+            prompt=pack.prompt or "",
+            examples=lx_examples,
+            extraction_passes=1,
+            max_char_buffer=MAX_CHAR_BUFFER,
+        )
+        if len(chunks) > 1 and getattr(provider, "accepts_document_batches", False):
+            # One batched call so LangExtract schedules all chunks on its own workers  # [CHANGED]
+            batch = provider.extract(
+                text_or_documents=[lx.data.Document(text=ch) for ch in chunks],
+                max_workers=min(len(chunks), MAX_WORKERS_EXTRACT),
+                **extract_kwargs,
             )
-            chunk_results.append(res)
-
-        # --- Merge all chunk results into one ---  # [ADDED]
-        result = merge_extractions(chunk_results)
+            result = {"documents": list(batch)}
+        else:
+            # Single chunk, or a provider that only takes plain text
+            chunk_results = [
+                provider.extract(text_or_documents=ch, max_workers=MAX_WORKERS_EXTRACT, **extract_kwargs)
+                for ch in chunks
+            ]
+            # --- Merge all chunk results into one ---  # [ADDED]
+            result = merge_extractions(chunk_results)
         print_doc_stats("post-merge", result)  # [ADDED]
 
         # Fallback to sanity rules if empty
         if not has_extractions(result):
-            print(f"[WARN] No extractions/entities for {name}; using sanity rules fallback.")  # [CHANGED]
+            log.warning("No extractions/entities for %s; using sanity rules fallback.", name)  # [CHANGED]
             result = run_sanity_rules(text)
             print_doc_stats("fallback", result)  # [ADDED]
 
         # Save JSONL
         save_jsonl_utf8(result, out_dir)
 
-        # Visualize
-        try:
-            vis = lx.visualize(str(out_dir / "data.jsonl"))
-            with open(out_dir / "review.html", "w", encoding="utf-8", errors="replace") as f:
-                f.write(vis if isinstance(vis, str) else vis.data)
-        except Exception as viz_e:
-            (out_dir / "_viz_error.txt").write_text(str(viz_e), encoding="utf-8", errors="replace")
+        # Visualize (opt-in)
+        write_review_html(result, out_dir)
 
         # Evaluate & save reports (with optional LLM override from CLI)
         llm_override = getattr(process_document, '_llm_override', None)
@@ -350,22 +419,17 @@ def process_document(name: str, text: str, pack_dict: dict, outputs_dir_str: str
         save_markdown(report, out_dir)
         save_txt(report, out_dir)
 
-        print(f"✓ Finished {name} (pack: {pack.id})")
+        log.info("✓ Finished %s (pack: %s)", name, pack.id)
         return (name, pack.id, str(out_dir))
 
     except Exception as e:
         # Degrade gracefully
-        print(f"[ERROR] {name}: {e} — writing fallback artifacts.")
+        log.error("%s: %s — writing fallback artifacts.", name, e)
         (out_dir / "_error.txt").write_text(str(e), encoding="utf-8", errors="replace")
 
         fb = run_sanity_rules(text)
         save_jsonl_utf8(fb, out_dir)
-        try:
-            vis = lx.visualize(str(out_dir / "data.jsonl"))
-            with open(out_dir / "review.html", "w", encoding="utf-8", errors="replace") as f:
-                f.write(vis if isinstance(vis, str) else vis.data)
-        except Exception as viz_e:
-            (out_dir / "_viz_error.txt").write_text(str(viz_e), encoding="utf-8", errors="replace")
+        write_review_html(fb, out_dir)
 
         llm_override = getattr(process_document, '_llm_override', None)
         report = make_report(document_name=name, text=text, rules=pack.rules, llm_override=llm_override)
@@ -374,6 +438,39 @@ def process_document(name: str, text: str, pack_dict: dict, outputs_dir_str: str
 
         return (name, pack.id, str(out_dir))
 
+# ------------------------------
+# Duplicate documents  # [ADDED]
+# ------------------------------
+def _text_digest(text: str) -> bytes:
+    return hashlib.blake2b((text or "").encode("utf-8", "replace"), digest_size=16).digest()
+
+def process_duplicate(name: str, text: str, pack_id: str, outputs_dir_str: str, source_name: str) -> tuple[str, str, str]:
+    """
+    For a document whose text is identical to an already processed one, reuse that
+    document's data.jsonl (hardlinked where possible) instead of calling the LLM
+    extractor again. The report is still built under this document's own name.
+    """
+    outputs_dir = Path(outputs_dir_str)
+    src = safe_out_dir(outputs_dir, source_name) / "data.jsonl"
+    if not src.is_file():
+        return process_document(name, text, pack_id, outputs_dir_str)
+
+    out_dir = safe_out_dir(outputs_dir, name)
+    data_path = ensure_file_path_is_clear(out_dir)
+    data_path.unlink(missing_ok=True)
+    try:
+        os.link(src, data_path)
+    except OSError:
+        shutil.copyfile(src, data_path)
+    write_review_html(None, out_dir)
+
+    pack = _PACKS[pack_id]
+    llm_override = getattr(process_document, '_llm_override', None)
+    report = make_report(document_name=name, text=text, rules=pack.rules, llm_override=llm_override)
+    save_markdown(report, out_dir)
+    save_txt(report, out_dir)
+    return (name, pack.id, str(out_dir))
+
 # ------------------------------
 # Main
 # ------------------------------
@@ -383,64 +480,92 @@ def main():
     parser.add_argument("--no-llm", action="store_true", help="Disable LLM explanations for debugging")
     args = parser.parse_args()
 
-    # Set LLM override on the process_document function (for worker access)
-    if args.no_llm:
-        process_document._llm_override = False
-        print("[CLI] LLM explanations disabled via --no-llm flag")
-
-    init_db()  # safe to call every run
-
-    # 1) Load active packs from Postgres
-    with SessionLocal() as db:
-        packs_dict = load_packs_for_runtime(db)  # already {id: RulePack}
-
-    if not packs_dict:
-        raise RuntimeError("No active rule packs found in the database. Import/publish one first.")
-
-    # 2) Ingest PDFs → text
-    texts = ingest()  # { name: text, ... }
-
-    outputs_dir = Path("outputs")
-    outputs_dir.mkdir(parents=True, exist_ok=True)
-
-    # 3) Decide which pack each doc will use (regex-based)
-    plan: list[tuple[str, str, dict]] = []  # (name, text, pack_dict)
-    default_pack_id = next(iter(packs_dict.keys()))
-    for name, text in texts.items():
-        pack_id = guess_doc_type_id(text, packs_dict) or default_pack_id
-        pack = packs_dict[pack_id]
-        # to be picklable across processes, pass a dict
-        pack_dict = pack.dict() if hasattr(pack, "dict") else {
-            "id": pack.id,
-            "doc_type_names": list(getattr(pack, "doc_type_names", [])),
-            "rules": getattr(pack, "rules").dict() if hasattr(pack, "rules") else {},
-            "prompt": getattr(pack, "prompt", "") or "",
-            "examples": [e.dict() if hasattr(e, "dict") else e for e in getattr(pack, "examples", [])],
-        }
-        plan.append((name, text, pack_dict))
-
-    # 4) Optional concurrency (default to a safe low number for local LLMs)
-    max_workers = int(os.getenv("CE_MAX_WORKERS", "1"))  # tune for your machine / model
-    if max_workers <= 1:
-        # Serial processing
-        for (name, text, pack_dict) in plan:
-            process_document(name, text, pack_dict, str(outputs_dir))
-            time.sleep(0.2)  # gentle throttle
-    else:
-        # Parallel (per-document) processing
-        with ProcessPoolExecutor(max_workers=max_workers) as ex:
-            futures = [
-                ex.submit(process_document, name, text, pack_dict, str(outputs_dir))
-                for (name, text, pack_dict) in plan
-            ]
-            for fut in as_completed(futures):
-                try:
-                    name, pack_id, out_dir = fut.result()
-                    print(f"Artifacts for {name} → {out_dir}")
-                except Exception as e:
-                    print(f"[ERROR] Worker failed: {e}")
-
-    print("=== Done with all PDFs ===")
+    log_queue, listener = _start_log_listener()
+    try:
+        # Set LLM override on the process_document function (for worker access)
+        if args.no_llm:
+            process_document._llm_override = False
+            log.info("[CLI] LLM explanations disabled via --no-llm flag")
+
+        init_db()  # safe to call every run
+
+        # 1) Load active packs from Postgres
+        with SessionLocal() as db:
+            packs_dict = load_packs_for_runtime(db)  # already {id: RulePack}
+
+        if not packs_dict:
+            raise RuntimeError("No active rule packs found in the database. Import/publish one first.")
+
+        # 2) Ingest PDFs → text
+        texts = ingest()  # { name: text, ... }
+
+        outputs_dir = Path("outputs")
+        outputs_dir.mkdir(parents=True, exist_ok=True)
+
+        # 3) Decide which pack each doc will use (regex-based)
+        plan: list[tuple[str, str, str]] = []  # (name, text, pack_id)
+        duplicates: list[tuple[str, str, str, str]] = []  # (name, text, pack_id, source_name)
+        first_by_digest: dict[bytes, tuple[str, str]] = {}  # text digest -> (name, pack_id)
+        pack_dicts: dict[str, dict] = {}  # only the packs actually used, built once each
+        default_pack_id = next(iter(packs_dict.keys()))
+        for name, text in texts.items():
+            digest = _text_digest(text)
+            if digest in first_by_digest:
+                # Byte-identical text: reuse the first copy's extraction
+                source_name, pack_id = first_by_digest[digest]
+                duplicates.append((name, text, pack_id, source_name))
+                continue
+            pack_id = guess_doc_type_id(text, packs_dict) or default_pack_id
+            first_by_digest[digest] = (name, pack_id)
+            if pack_id not in pack_dicts:
+                pack = packs_dict[pack_id]
+                # to be picklable across processes, pass a dict
+                pack_dicts[pack_id] = pack.dict() if hasattr(pack, "dict") else {
+                    "id": pack.id,
+                    "doc_type_names": list(getattr(pack, "doc_type_names", [])),
+                    "rules": getattr(pack, "rules").dict() if hasattr(pack, "rules") else {},
+                    "prompt": getattr(pack, "prompt", "") or "",
+                    "examples": [e.dict() if hasattr(e, "dict") else e for e in getattr(pack, "examples", [])],
+                }
+            plan.append((name, text, pack_id))
+
+        # 4) Optional concurrency (default to a safe low number for local LLMs)
+        max_workers = int(os.getenv("CE_MAX_WORKERS", "1"))  # tune for your machine / model
+        _load_packs(pack_dicts)  # serial path and duplicate reports run in this process
+        if max_workers <= 1:
+            # Serial processing
+            for (name, text, pack_id) in plan:
+                process_document(name, text, pack_id, str(outputs_dir))
+        else:
+            # Parallel (per-document) processing; workers are initialized once
+            # and receive pack state there, so each submit only ships a pack id
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_worker_init,
+                initargs=(pack_dicts, getattr(process_document, "_llm_override", None), log_queue),
+            ) as ex:
+                futures = [
+                    ex.submit(process_document, name, text, pack_id, str(outputs_dir))
+                    for (name, text, pack_id) in plan
+                ]
+                for fut in as_completed(futures):
+                    try:
+                        name, pack_id, out_dir = fut.result()
+                        log.info("Artifacts for %s → %s", name, out_dir)
+                    except Exception as e:
+                        log.error("Worker failed: %s", e)
+
+        # 5) Exact duplicates: link the extraction, re-run only the report
+        for (name, text, pack_id, source_name) in duplicates:
+            try:
+                _, _, out_dir = process_duplicate(name, text, pack_id, str(outputs_dir), source_name)
+                log.info("Artifacts for %s → %s (duplicate of %s)", name, out_dir, source_name)
+            except Exception as e:
+                log.error("Duplicate %s failed: %s", name, e)
+
+        log.info("=== Done with all PDFs ===")
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     # Force local provider by default
@@ -140,7 +140,11 @@ import os
 import yaml
 import re
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Any, Sequence, Optional, Tuple, Dict
 from decimal import Decimal
@@ -151,7 +155,10 @@ except ImportError:
     # Fallback if langextract not available
     lx = None
 
-from infrastructure import RuleSet, DocumentReport, Finding
+from infrastructure import (
+    RuleSet, DocumentReport, Finding, settings, to_json_bytes,
+    make_citation, make_finding, make_compliance_check,
+)
 
 # ========================================
 # SAFE DEBUG PRINTING (Windows console compatibility)
@@ -183,6 +190,9 @@ def _safe_debug_snippet(label: str, text: str, max_len: int = 500) -> None:
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # True when extract() accepts a list of lx.data.Document in one call
+    accepts_document_batches: bool = False
+
     @abstractmethod
     def extract(
         self,
@@ -198,9 +208,36 @@ class LLMProvider(ABC):
         ...
 
 
+@lru_cache(maxsize=1)
+def _http_session():
+    """
+    Shared keep-alive session for Ollama calls, so repeated completions reuse
+    pooled connections instead of opening a new socket per request. Sized for
+    the concurrent per-finding explanation requests.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Exact-match cache for OllamaProvider.complete(). Prompts are sent at low
+# temperature, so an identical (model, url, prompt) - the same document re-run,
+# a retried request - can reuse the earlier answer instead of another LLM call.
+# Keyed on a prompt digest so the cache doesn't hold full contract-sized prompts.
+_COMPLETION_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_COMPLETION_CACHE_LOCK = threading.Lock()
+
+
 class OllamaProvider(LLMProvider):
     """Ollama LLM provider implementation."""
 
+    accepts_document_batches = True  # extract() forwards to lx.extract, which takes Documents
+
     def __init__(self, model_id="llama3:8b-instruct-q4_K_M", url="http://localhost:11434"):
         self.model_id = model_id
         self.url = url
@@ -229,12 +266,37 @@ class OllamaProvider(LLMProvider):
         Used by Phase 2 rulepacks. Returns raw text (usually JSON).
         DO NOT return an object with .extractions here.
 
+        Identical prompts are answered from an in-process LRU cache
+        (settings.LLM_CACHE_SIZE entries; 0 disables it).
+
         Args:
             prompt: The prompt to send to the LLM
 
         Returns:
             Raw text response from the LLM
         """
+        if settings.LLM_CACHE_SIZE <= 0:
+            return self._complete_uncached(prompt)
+
+        key = (self.model_id, self.url, hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest())
+        with _COMPLETION_CACHE_LOCK:
+            content = _COMPLETION_CACHE.get(key)
+            if content is not None:
+                _COMPLETION_CACHE.move_to_end(key)
+                return content
+
+        content = self._complete_uncached(prompt)
+        if not content:
+            # Empty means the call failed or returned nothing; let the next call retry
+            return content
+        with _COMPLETION_CACHE_LOCK:
+            _COMPLETION_CACHE[key] = content
+            if len(_COMPLETION_CACHE) > settings.LLM_CACHE_SIZE:
+                _COMPLETION_CACHE.popitem(last=False)
+        return content
+
+    def _complete_uncached(self, prompt: str) -> str:
+        """Send the prompt to Ollama (OpenAI-compatible API, then legacy /api/generate)."""
         import requests
         import logging
 
@@ -268,7 +330,7 @@ class OllamaProvider(LLMProvider):
                         "stream": False
                     }
 
-                    response = requests.post(ollama_url, json=payload, timeout=120)
+                    response = _http_session().post(ollama_url, json=payload, timeout=120)
                     response.raise_for_status()
 
                     result_json = response.json()
@@ -289,7 +351,7 @@ class OllamaProvider(LLMProvider):
                         }
                     }
 
-                    response = requests.post(ollama_url, json=payload, timeout=120)
+                    response = _http_session().post(ollama_url, json=payload, timeout=120)
                     response.raise_for_status()
 
                     result_json = response.json()
@@ -320,6 +382,13 @@ class OllamaProvider(LLMProvider):
 # LLM PROVIDER FACTORY
 # ========================================
 
+@lru_cache(maxsize=4)
+def _load_llm_config(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse llm.yaml; (mtime_ns, size) in the cache key drops stale entries on edit."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 def load_provider(config_path: str = "llm.yaml") -> LLMProvider:
     """
     Load and configure an LLM provider.
@@ -330,10 +399,12 @@ def load_provider(config_path: str = "llm.yaml") -> LLMProvider:
     Returns:
         Configured LLM provider instance
     """
-    cfg = {}
-    if os.path.exists(config_path):
-        with open(config_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        cfg = {}
+    else:
+        cfg = _load_llm_config(config_path, st.st_mtime_ns, st.st_size)
 
     kind = os.getenv("LLM_PROVIDER", cfg.get("provider", "ollama")).lower()
     if kind == "ollama":
@@ -622,8 +693,7 @@ def extract_lease_fields(
     Returns:
         LeaseExtraction object with populated fields
     """
-    from infrastructure import LeaseExtraction, settings
-    import requests
+    from infrastructure import LeaseExtraction
     import json
 
     # DEBUG: Log extraction attempt
@@ -666,7 +736,7 @@ Return JSON now:"""
         }
 
         print(f"[DEBUG] Sending request to Ollama...")
-        response = requests.post(ollama_url, json=payload, timeout=60)
+        response = _http_session().post(ollama_url, json=payload, timeout=60)
         response.raise_for_status()
 
         result_json = response.json()
@@ -764,6 +834,29 @@ FRAUD_RE = re.compile(r'\bfraud\b', re.IGNORECASE)
 OTHER_PARTY_HEURISTIC_RE = re.compile(r'(sole|entire)\s+responsibility|liab(?:ility)?\s+(?:of|on)\s+(?:the\s+)?other\s+party', re.IGNORECASE)
 SIGNATURE_NOISE = re.compile(r'(signature page follows|confidential|translation, for reference only)', re.IGNORECASE)
 
+# Fallback presence keywords for the lease.* custom rules, compiled once
+LEASE_RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "lease.property": ("property", "premises", "leased premises"),
+    "lease.tenant": ("tenant", "lessee"),
+    "lease.dates": ("commencement", "expiration", "term"),
+    "lease.rent": ("base rent", "monthly rent", "annual rent"),
+    "lease.security": ("security deposit", "deposit"),
+    "lease.options": ("option to renew", "renewal option", "extension", "expansion", "termination"),
+    "lease.fees": ("late fee", "late charge", "late payment", "default rate"),
+    "lease.default": ("default", "breach", "cure period", "notice of default", "event of default"),
+    "lease.expenses": ("operating expense", "cam", "common area maintenance", "nnn", "triple net", "tax recovery", "insurance recovery"),
+}
+_LEASE_RULE_RES = {
+    rule_id: re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+    for rule_id, keywords in LEASE_RULE_KEYWORDS.items()
+}
+
+
+def lease_keyword_present(text: str, rule_id: str) -> bool:
+    """True if any fallback keyword for a lease.* rule appears in text."""
+    return _LEASE_RULE_RES[rule_id].search(text) is not None
+
+
 def _norm_amount(txt: str):
     """Normalize monetary amount string to float."""
     try:
@@ -797,11 +890,11 @@ def find_liability_section(text: str):
 
 def window_quote(text: str, span, pad: int = 140):
     """Create a Citation with context window."""
-    from infrastructure import Citation
     s, e = span
     qs = max(0, s - pad)
     qe = min(len(text), e + pad)
-    return Citation(char_start=s, char_end=e, quote=text[qs:qe])
+    # Spans come straight from re.Match, so skip pydantic validation
+    return make_citation(char_start=s, char_end=e, quote=text[qs:qe])
 
 def _strip_noise(text: str) -> str:
     """Remove signature noise from text."""
@@ -817,7 +910,7 @@ def check_liability_cap_present_and_within_bounds(text: str, rules: RuleSet, con
     """Check if liability cap is present and within configured bounds."""
     sec_span = find_liability_section(text)
     if sec_span is None:
-        return Finding(
+        return make_finding(
             rule_id="liability_cap_present_and_within_bounds",
             passed=False,
             details="No clear 'Limitation of Liability' section found.",
@@ -853,7 +946,7 @@ def check_liability_cap_present_and_within_bounds(text: str, rules: RuleSet, con
         cap_ok = False
         notes.append("No clear cap indicator ('12 months of fees' or explicit monetary cap) detected.")
 
-    return Finding(
+    return make_finding(
         rule_id="liability_cap_present_and_within_bounds",
         passed=cap_ok,
         details="; ".join(notes) if notes else ("Cap appears within configured bounds." if cap_ok else "Cap not within bounds."),
@@ -863,7 +956,7 @@ def check_liability_cap_present_and_within_bounds(text: str, rules: RuleSet, con
 def check_contract_value_within_limit(text: str, rules: RuleSet):
     """Check if contract value is within configured limit."""
     if rules.contract.max_contract_value is None:
-        return Finding(
+        return make_finding(
             rule_id="contract_value_within_limit",
             passed=True,
             details="No max contract value configured; skipping.",
@@ -871,7 +964,7 @@ def check_contract_value_within_limit(text: str, rules: RuleSet):
         )
     mm = max_money(text)
     if not mm:
-        return Finding(
+        return make_finding(
             rule_id="contract_value_within_limit",
             passed=True,
             details="Could not identify a contract value; no obvious monetary amounts found.",
@@ -879,7 +972,7 @@ def check_contract_value_within_limit(text: str, rules: RuleSet):
         )
     amt, cur, span = mm
     passed = amt <= rules.contract.max_contract_value
-    return Finding(
+    return make_finding(
         rule_id="contract_value_within_limit",
         passed=passed,
         details=f"Largest detected amount {cur}{amt:,.2f} {'is within' if passed else 'exceeds'} configured limit {rules.contract.max_contract_value:,.2f}.",
@@ -893,10 +986,8 @@ def check_fraud_clause_present_and_assigned(text: str, rules: RuleSet):
     BUGFIX: Now reports ALL fraud clause instances found (not just the first),
     allowing users to see all fraud references in the document.
     """
-    from infrastructure import Citation
-
     if not rules.fraud.require_fraud_clause:
-        return Finding(
+        return make_finding(
             rule_id="fraud_clause_present_and_assigned",
             passed=True,
             details="Fraud clause not required by config.",
@@ -906,7 +997,7 @@ def check_fraud_clause_present_and_assigned(text: str, rules: RuleSet):
     matches = list(FRAUD_RE.finditer(text))
 
     if not matches:
-        return Finding(
+        return make_finding(
             rule_id="fraud_clause_present_and_assigned",
             passed=False,
             details="No 'fraud' mention found.",
@@ -924,7 +1015,7 @@ def check_fraud_clause_present_and_assigned(text: str, rules: RuleSet):
         window_e = min(len(text), e+300)
         nearby = text[window_s:window_e]
 
-        all_citations.append(Citation(char_start=s, char_end=e, quote=nearby))
+        all_citations.append(make_citation(char_start=s, char_end=e, quote=nearby))
 
         if rules.fraud.require_liability_on_other_party:
             if not OTHER_PARTY_HEURISTIC_RE.search(nearby):
@@ -950,7 +1041,7 @@ def check_fraud_clause_present_and_assigned(text: str, rules: RuleSet):
                 assigned_count = sum(1 for d in assignment_details if "assigned to other party" in d)
                 note += f"{assigned_count}/{len(matches)} instances have liability properly assigned to the other party."
 
-    return Finding(
+    return make_finding(
         rule_id="fraud_clause_present_and_assigned",
         passed=all_assigned_ok,
         details=note,
@@ -967,7 +1058,7 @@ def check_jurisdiction_present_and_allowed(text: str, rules: RuleSet):
     matches = list(GOV_LAW_RE.finditer(text))
 
     if not matches:
-        return Finding(
+        return make_finding(
             rule_id="jurisdiction_present_and_allowed",
             passed=False,
             details="No clear 'governing law / jurisdiction' clause detected.",
@@ -996,7 +1087,7 @@ def check_jurisdiction_present_and_allowed(text: str, rules: RuleSet):
         jur_list = ', '.join(f'"{j}"' for j in jurisdictions)
         details = f'Multiple jurisdiction clauses found: {jur_list}. {"All allowed" if all_allowed else "One or more not in allowed list."}'
 
-    return Finding(
+    return make_finding(
         rule_id="jurisdiction_present_and_allowed",
         passed=all_allowed,
         details=details,
@@ -1015,7 +1106,7 @@ def check_lease_property(text: str, params: dict, extraction: Optional['LeaseExt
     require_details = params.get('require_property_details', True)
 
     if not require_details:
-        return Finding(
+        return make_finding(
             rule_id="lease.property",
             passed=True,
             details="Property details check not required by rule configuration.",
@@ -1028,7 +1119,7 @@ def check_lease_property(text: str, params: dict, extraction: Optional['LeaseExt
         has_address = bool(extraction.property_address)
 
         if has_name and has_address:
-            return Finding(
+            return make_finding(
                 rule_id="lease.property",
                 passed=True,
                 details=f"Property identified: {extraction.property_name} at {extraction.property_address}",
@@ -1040,7 +1131,7 @@ def check_lease_property(text: str, params: dict, extraction: Optional['LeaseExt
                 missing.append("property name")
             if not has_address:
                 missing.append("property address")
-            return Finding(
+            return make_finding(
                 rule_id="lease.property",
                 passed=False,
                 details=f"Missing required property details: {', '.join(missing)}",
@@ -1048,8 +1139,8 @@ def check_lease_property(text: str, params: dict, extraction: Optional['LeaseExt
             )
 
     # Fallback: text search
-    has_property_info = bool(re.search(r'(property|premises|leased premises)', text, re.IGNORECASE))
-    return Finding(
+    has_property_info = lease_keyword_present(text, "lease.property")
+    return make_finding(
         rule_id="lease.property",
         passed=has_property_info,
         details="Property information found in contract text." if has_property_info else "Property information not clearly identified.",
@@ -1064,7 +1155,7 @@ def check_lease_tenant(text: str, params: dict, extraction: Optional['LeaseExtra
     require_details = params.get('require_tenant_details', True)
 
     if not require_details:
-        return Finding(
+        return make_finding(
             rule_id="lease.tenant",
             passed=True,
             details="Tenant details check not required by rule configuration.",
@@ -1072,7 +1163,7 @@ def check_lease_tenant(text: str, params: dict, extraction: Optional['LeaseExtra
         )
 
     if extraction and extraction.tenant_legal_name:
-        return Finding(
+        return make_finding(
             rule_id="lease.tenant",
             passed=True,
             details=f"Tenant identified: {extraction.tenant_legal_name}",
@@ -1080,8 +1171,8 @@ def check_lease_tenant(text: str, params: dict, extraction: Optional['LeaseExtra
         )
 
     # Fallback: text search
-    has_tenant = bool(re.search(r'(tenant|lessee)', text, re.IGNORECASE))
-    return Finding(
+    has_tenant = lease_keyword_present(text, "lease.tenant")
+    return make_finding(
         rule_id="lease.tenant",
         passed=has_tenant,
         details="Tenant information found." if has_tenant else "Tenant information not clearly identified.",
@@ -1108,7 +1199,7 @@ def check_lease_dates(text: str, params: dict, extraction: Optional['LeaseExtrac
 
     # If none required, skip check
     if not (require_execution or require_commencement or require_expiration):
-        return Finding(
+        return make_finding(
             rule_id="lease.dates",
             passed=True,
             details="Lease dates check not required by rule configuration.",
@@ -1141,14 +1232,14 @@ def check_lease_dates(text: str, params: dict, extraction: Optional['LeaseExtrac
                 missing.append("expiration date")
 
         if missing:
-            return Finding(
+            return make_finding(
                 rule_id="lease.dates",
                 passed=False,
                 details=f"Missing required lease dates per rulepack: {', '.join(missing)}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.dates",
                 passed=True,
                 details=f"Lease dates found: {', '.join(found)}",
@@ -1156,8 +1247,8 @@ def check_lease_dates(text: str, params: dict, extraction: Optional['LeaseExtrac
             )
 
     # Fallback: text search
-    has_dates = bool(re.search(r'(commencement|expiration|term)', text, re.IGNORECASE))
-    return Finding(
+    has_dates = lease_keyword_present(text, "lease.dates")
+    return make_finding(
         rule_id="lease.dates",
         passed=has_dates,
         details="Lease dates found in text." if has_dates else "Lease dates not clearly identified.",
@@ -1181,7 +1272,7 @@ def check_lease_rent(text: str, params: dict, extraction: Optional['LeaseExtract
     require_payment_frequency = params.get('require_payment_frequency', False)
 
     if not (require_base_rent or require_payment_frequency):
-        return Finding(
+        return make_finding(
             rule_id="lease.rent",
             passed=True,
             details="Rent details check not required by rule configuration.",
@@ -1207,14 +1298,14 @@ def check_lease_rent(text: str, params: dict, extraction: Optional['LeaseExtract
                 missing.append("payment frequency")
 
         if missing:
-            return Finding(
+            return make_finding(
                 rule_id="lease.rent",
                 passed=False,
                 details=f"Missing required rent details per rulepack: {', '.join(missing)}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.rent",
                 passed=True,
                 details=f"Rent details found: {', '.join(found)}",
@@ -1222,8 +1313,8 @@ def check_lease_rent(text: str, params: dict, extraction: Optional['LeaseExtract
             )
 
     # Fallback: text search for rent amounts
-    has_rent = bool(re.search(r'(base rent|monthly rent|annual rent)', text, re.IGNORECASE))
-    return Finding(
+    has_rent = lease_keyword_present(text, "lease.rent")
+    return make_finding(
         rule_id="lease.rent",
         passed=has_rent,
         details="Rent information found in text." if has_rent else "Rent information not clearly identified.",
@@ -1246,7 +1337,7 @@ def check_lease_security(text: str, params: dict, extraction: Optional['LeaseExt
     require_security = params.get('check_security_deposit', params.get('require_security_deposit', True))
 
     if not require_security:
-        return Finding(
+        return make_finding(
             rule_id="lease.security",
             passed=True,
             details="Security deposit check not required by rule configuration.",
@@ -1254,7 +1345,7 @@ def check_lease_security(text: str, params: dict, extraction: Optional['LeaseExt
         )
 
     if extraction and extraction.security_deposit_amount:
-        return Finding(
+        return make_finding(
             rule_id="lease.security",
             passed=True,
             details=f"Security deposit: {extraction.security_deposit_amount}",
@@ -1262,8 +1353,8 @@ def check_lease_security(text: str, params: dict, extraction: Optional['LeaseExt
         )
 
     # Fallback: text search
-    has_security = bool(re.search(r'(security deposit|deposit)', text, re.IGNORECASE))
-    return Finding(
+    has_security = lease_keyword_present(text, "lease.security")
+    return make_finding(
         rule_id="lease.security",
         passed=has_security,
         details="Security deposit information found." if has_security else "Security deposit information not clearly identified.",
@@ -1289,7 +1380,7 @@ def check_lease_options(text: str, params: dict, extraction: Optional['LeaseExtr
     check_termination = params.get('check_termination_options', False)
 
     if not (check_renewal or check_expansion or check_termination):
-        return Finding(
+        return make_finding(
             rule_id="lease.options",
             passed=True,
             details="Lease options check not required by rule configuration.",
@@ -1319,14 +1410,14 @@ def check_lease_options(text: str, params: dict, extraction: Optional['LeaseExtr
                 missing.append("termination options")
 
         if missing:
-            return Finding(
+            return make_finding(
                 rule_id="lease.options",
                 passed=False,
                 details=f"Missing required lease options per rulepack: {', '.join(missing)}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.options",
                 passed=True,
                 details=f"Lease options found: {', '.join(found)}",
@@ -1334,8 +1425,8 @@ def check_lease_options(text: str, params: dict, extraction: Optional['LeaseExtr
             )
 
     # Fallback: text search
-    has_options = bool(re.search(r'(option to renew|renewal option|extension|expansion|termination)', text, re.IGNORECASE))
-    return Finding(
+    has_options = lease_keyword_present(text, "lease.options")
+    return make_finding(
         rule_id="lease.options",
         passed=has_options,
         details="Lease options found in text." if has_options else "Lease options not clearly identified.",
@@ -1357,7 +1448,7 @@ def check_lease_fees(text: str, params: dict, extraction: Optional['LeaseExtract
     require_late_fees = params.get('require_late_fee_terms', False)
 
     if not require_late_fees:
-        return Finding(
+        return make_finding(
             rule_id="lease.fees",
             passed=True,
             details="Late fee terms check not required by rule configuration.",
@@ -1366,14 +1457,14 @@ def check_lease_fees(text: str, params: dict, extraction: Optional['LeaseExtract
 
     if extraction:
         if extraction.late_payment_penalty:
-            return Finding(
+            return make_finding(
                 rule_id="lease.fees",
                 passed=True,
                 details=f"Late fee terms found: {extraction.late_payment_penalty}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.fees",
                 passed=False,
                 details="Missing required late fee terms per rulepack.",
@@ -1381,8 +1472,8 @@ def check_lease_fees(text: str, params: dict, extraction: Optional['LeaseExtract
             )
 
     # Fallback: text search
-    has_late_fees = bool(re.search(r'(late fee|late charge|late payment|default rate)', text, re.IGNORECASE))
-    return Finding(
+    has_late_fees = lease_keyword_present(text, "lease.fees")
+    return make_finding(
         rule_id="lease.fees",
         passed=has_late_fees,
         details="Late fee terms found in text." if has_late_fees else "Late fee terms not clearly identified.",
@@ -1404,7 +1495,7 @@ def check_lease_default(text: str, params: dict, extraction: Optional['LeaseExtr
     require_default = params.get('require_default_terms', False)
 
     if not require_default:
-        return Finding(
+        return make_finding(
             rule_id="lease.default",
             passed=True,
             details="Default provisions check not required by rule configuration.",
@@ -1419,14 +1510,14 @@ def check_lease_default(text: str, params: dict, extraction: Optional['LeaseExtr
             found.append(f"cure period: {extraction.cure_period_days} days")
 
         if found:
-            return Finding(
+            return make_finding(
                 rule_id="lease.default",
                 passed=True,
                 details=f"Default provisions found: {', '.join(found)}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.default",
                 passed=False,
                 details="Missing required default provisions per rulepack.",
@@ -1434,8 +1525,8 @@ def check_lease_default(text: str, params: dict, extraction: Optional['LeaseExtr
             )
 
     # Fallback: text search
-    has_default = bool(re.search(r'(default|breach|cure period|notice of default|event of default)', text, re.IGNORECASE))
-    return Finding(
+    has_default = lease_keyword_present(text, "lease.default")
+    return make_finding(
         rule_id="lease.default",
         passed=has_default,
         details="Default provisions found in text." if has_default else "Default provisions not clearly identified.",
@@ -1461,7 +1552,7 @@ def check_lease_expenses(text: str, params: dict, extraction: Optional['LeaseExt
     check_insurance = params.get('check_insurance_recovery', False)
 
     if not (check_cam or check_tax or check_insurance):
-        return Finding(
+        return make_finding(
             rule_id="lease.expenses",
             passed=True,
             details="Operating expense checks not required by rule configuration.",
@@ -1491,14 +1582,14 @@ def check_lease_expenses(text: str, params: dict, extraction: Optional['LeaseExt
                 missing.append("insurance recovery")
 
         if missing:
-            return Finding(
+            return make_finding(
                 rule_id="lease.expenses",
                 passed=False,
                 details=f"Missing required operating expense details per rulepack: {', '.join(missing)}",
                 citations=[]
             )
         else:
-            return Finding(
+            return make_finding(
                 rule_id="lease.expenses",
                 passed=True,
                 details=f"Operating expenses found: {', '.join(found)}",
@@ -1506,8 +1597,8 @@ def check_lease_expenses(text: str, params: dict, extraction: Optional['LeaseExt
             )
 
     # Fallback: text search
-    has_expenses = bool(re.search(r'(operating expense|CAM|common area maintenance|NNN|triple net|tax recovery|insurance recovery)', text, re.IGNORECASE))
-    return Finding(
+    has_expenses = lease_keyword_present(text, "lease.expenses")
+    return make_finding(
         rule_id="lease.expenses",
         passed=has_expenses,
         details="Operating expense provisions found in text." if has_expenses else "Operating expense provisions not clearly identified.",
@@ -2246,7 +2337,8 @@ def build_preliminary_compliance_checks(
                     )
                     citations_list.append(phase2_citation)
 
-        result = ComplianceCheckResult(
+        # Every field is built here from typed Finding/config values - no validation needed
+        result = make_compliance_check(
             check_id=finding.rule_id,
             label=cfg["label"],
             status=status,
@@ -2719,12 +2811,42 @@ def _extract_json_block(text: str) -> str | None:
         cleaned = re.sub(r'in\s+JSON\s+format\s*:?\s*', '', cleaned, flags=re.IGNORECASE)
 
     # Find first '{' and last '}' to extract JSON object
-    import re
-    m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-    if not m:
-        return None
+    return _outer_braces(cleaned)
 
-    return m.group(0)
+
+def _outer_braces(text: str) -> str | None:
+    """
+    Return text from the first '{' through the last '}' after it, or None.
+
+    Same span as re.search(r'\{.*\}', text, re.DOTALL), found with two linear
+    scans instead of a backtracking search that goes quadratic when a
+    response has many '{' and no closing brace.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    end = text.rfind("}")
+    if end < start:
+        return None
+    return text[start:end + 1]
+
+
+# Fixed instructions for _maybe_add_llm_explanations(). Kept at the start of every
+# prompt so repeated calls share a stable prefix (Ollama reuses the KV cache for a
+# matching prompt prefix; hosted providers bill cached prefix tokens at a discount).
+_EXPLANATION_PROMPT_PREFIX = (
+    "You are a meticulous contracts analyst. Analyze the compliance finding failure below.\n\n"
+    "Provide your analysis in this JSON format:\n"
+    "{\n"
+    '  "reason_short": "1-2 sentence summary of why this failed",\n'
+    '  "reason_detailed": "Full analysis with Reasoning, Risk, and Fix recommendations",\n'
+    '  "summary": "Brief summary for tables/bullets"\n'
+    "}\n\n"
+    "The reason_short should be concise for tables. The reason_detailed should include:\n"
+    "- Reasoning: why this specific rule failed\n"
+    "- Risk: business/legal risk if unaddressed\n"
+    "- Fix: specific contract language to add/modify\n\n"
+)
 
 
 def _maybe_add_llm_explanations(text: str, rules: RuleSet, findings: List[Finding], max_failures: int = None, llm_override: bool = None) -> List[Finding]:
@@ -2732,8 +2854,6 @@ def _maybe_add_llm_explanations(text: str, rules: RuleSet, findings: List[Findin
     Append concise LLM rationales to failing findings. Now enabled by default.
     Always adds a status finding so it's obvious whether this step ran and which mode was used.
     """
-    from infrastructure import settings
-
     enabled = settings.get_llm_enabled(llm_override)
     max_failures = max_failures or settings.LLM_MAX_EXPLANATIONS
 
@@ -2763,121 +2883,129 @@ def _maybe_add_llm_explanations(text: str, rules: RuleSet, findings: List[Findin
         return findings
 
     used = 0
-    updated: List[Finding] = []
     failed_findings = [f for f in findings if not f.passed]
 
-    for f in findings:
-        if not f.passed and used < max_failures and f.rule_id != "llm_explanations_status":
-            # Local context around first citation
-            snippet = ""
-            if f.citations and len(f.citations) > 0:
-                c = f.citations[0]
-                s = max(0, min(len(text), c.char_start))
-                e = max(0, min(len(text), c.char_end))
-                snippet = text[max(0, s - 300): min(len(text), e + 300)]
-            elif text:
-                # If no citations, use first part of document
-                snippet = text[:600]
-
-            # Create context from only failed findings
-            failed_summary = "\n".join(f"- {x.rule_id}: {x.details[:100]}{'...' if len(x.details) > 100 else ''}" for x in failed_findings[:5] if x.rule_id != "llm_explanations_status")
-
-            prompt = (
-                "You are a meticulous contracts analyst. Analyze this compliance finding failure.\n\n"
-                f"Failed Finding: {f.rule_id}\n"
-                f"Details: {f.details}\n\n"
-                "Other failed findings for context:\n"
-                f"{failed_summary}\n\n"
-                "Relevant contract excerpt:\n-----\n"
-                f"{snippet[:800]}\n-----\n\n"
-                "Provide your analysis in this JSON format:\n"
-                "{\n"
-                '  "reason_short": "1-2 sentence summary of why this failed",\n'
-                '  "reason_detailed": "Full analysis with Reasoning, Risk, and Fix recommendations",\n'
-                '  "summary": "Brief summary for tables/bullets"\n'
-                "}\n\n"
-                "The reason_short should be concise for tables. The reason_detailed should include:\n"
-                "- Reasoning: why this specific rule failed\n"
-                "- Risk: business/legal risk if unaddressed\n"
-                "- Fix: specific contract language to add/modify\n"
-            )
-
-            try:
-                mode, rationale = _call_llm_any(provider, doc_text=text, prompt=prompt)
-                rationale = (rationale or "").strip()
-
-                if rationale and not rationale.startswith("[llm error:"):
-                    # Try to parse as JSON for structured response using the new helper
-                    import json
-
-                    # Extract JSON block (handles "in JSON format:" prefix and other noise)
-                    json_string = _extract_json_block(rationale)
-                    parsed_json = None
+    # Create context from only failed findings (same for every finding in this document)
+    failed_summary = "\n".join(f"- {x.rule_id}: {x.details[:100]}{'...' if len(x.details) > 100 else ''}" for x in failed_findings[:5] if x.rule_id != "llm_explanations_status")
+    doc_prompt_prefix = (
+        _EXPLANATION_PROMPT_PREFIX
+        + "Other failed findings for context:\n"
+        + f"{failed_summary}\n\n"
+    )
 
-                    if json_string:
-                        try:
-                            parsed_json = json.loads(json_string)
-                        except json.JSONDecodeError:
-                            # JSON extraction found { } but couldn't parse it
-                            pass
+    def _explain(f: Finding) -> Tuple[Optional[Finding], str]:
+        """LLM rationale for one failed finding -> (explained finding or None, status entry)."""
+        # Local context around first citation
+        snippet = ""
+        if f.citations and len(f.citations) > 0:
+            c = f.citations[0]
+            s = max(0, min(len(text), c.char_start))
+            e = max(0, min(len(text), c.char_end))
+            snippet = text[max(0, s - 300): min(len(text), e + 300)]
+        elif text:
+            # If no citations, use first part of document
+            snippet = text[:600]
+
+        # Static instructions + per-document context first, per-finding details
+        # last: every call for this document shares a byte-identical prefix
+        prompt = (
+            doc_prompt_prefix
+            + f"Failed Finding: {f.rule_id}\n"
+            f"Details: {f.details}\n\n"
+            "Relevant contract excerpt:\n-----\n"
+            f"{snippet[:800]}\n-----\n"
+        )
 
-                    # Extract short and detailed explanations
-                    if parsed_json:
-                        reason_short = _clean_llm_prefix(parsed_json.get("reason_short") or parsed_json.get("summary") or "")
-                        reason_detailed = _clean_llm_prefix(parsed_json.get("reason_detailed") or parsed_json.get("analysis") or parsed_json.get("full_explanation") or reason_short)
-                    else:
-                        # Fallback: JSON parsing failed, try to extract any readable text
-                        cleaned_rationale = _clean_llm_prefix(rationale)
-
-                        # Strategy 1: Try to extract text from JSON string literals if the response is malformed JSON
-                        if "{" in cleaned_rationale and "reason_short" in cleaned_rationale:
-                            # Extract anything that looks like a value in "reason_short": "VALUE"
-                            import re
-                            short_match = re.search(r'"reason_short"\s*:\s*"([^"]+)"', cleaned_rationale)
-                            if short_match:
-                                reason_short = short_match.group(1).strip()
-                                # Try to get reason_detailed too
-                                detailed_match = re.search(r'"reason_detailed"\s*:\s*"([^"]+)"', cleaned_rationale)
-                                if detailed_match:
-                                    reason_detailed = detailed_match.group(1).strip()
-                                else:
-                                    reason_detailed = reason_short
+        try:
+            mode, rationale = _call_llm_any(provider, doc_text=text, prompt=prompt)
+            rationale = (rationale or "").strip()
+
+            if rationale and not rationale.startswith("[llm error:"):
+                # Try to parse as JSON for structured response using the new helper
+                import json
+
+                # Extract JSON block (handles "in JSON format:" prefix and other noise)
+                json_string = _extract_json_block(rationale)
+                parsed_json = None
+
+                if json_string:
+                    try:
+                        parsed_json = json.loads(json_string)
+                    except json.JSONDecodeError:
+                        # JSON extraction found { } but couldn't parse it
+                        pass
+
+                # Extract short and detailed explanations
+                if parsed_json:
+                    reason_short = _clean_llm_prefix(parsed_json.get("reason_short") or parsed_json.get("summary") or "")
+                    reason_detailed = _clean_llm_prefix(parsed_json.get("reason_detailed") or parsed_json.get("analysis") or parsed_json.get("full_explanation") or reason_short)
+                else:
+                    # Fallback: JSON parsing failed, try to extract any readable text
+                    cleaned_rationale = _clean_llm_prefix(rationale)
+
+                    # Strategy 1: Try to extract text from JSON string literals if the response is malformed JSON
+                    if "{" in cleaned_rationale and "reason_short" in cleaned_rationale:
+                        # Extract anything that looks like a value in "reason_short": "VALUE"
+                        import re
+                        short_match = re.search(r'"reason_short"\s*:\s*"([^"]+)"', cleaned_rationale)
+                        if short_match:
+                            reason_short = short_match.group(1).strip()
+                            # Try to get reason_detailed too
+                            detailed_match = re.search(r'"reason_detailed"\s*:\s*"([^"]+)"', cleaned_rationale)
+                            if detailed_match:
+                                reason_detailed = detailed_match.group(1).strip()
                             else:
-                                # Couldn't extract from JSON pattern, filter out JSON and use plain text
-                                lines = cleaned_rationale.split('\n')
-                                clean_lines = [line for line in lines if '{' not in line and '}' not in line and '"' not in line and line.strip()]
-                                if clean_lines:
-                                    cleaned_rationale = ' '.join(clean_lines)
-                                    sentences = cleaned_rationale.split('.')
-                                    reason_short = '. '.join(sentences[:2]).strip() + '.' if len(sentences) > 1 else cleaned_rationale[:140]
-                                    reason_detailed = cleaned_rationale
-                                else:
-                                    # Last resort: just use the original details field
-                                    reason_short = f.details[:140]
-                                    reason_detailed = f.details
+                                reason_detailed = reason_short
                         else:
-                            # No JSON detected, treat as plain text
-                            sentences = cleaned_rationale.split('.')
-                            reason_short = '. '.join(sentences[:2]).strip() + '.' if len(sentences) > 1 else cleaned_rationale[:140]
-                            reason_detailed = cleaned_rationale
+                            # Couldn't extract from JSON pattern, filter out JSON and use plain text
+                            lines = cleaned_rationale.split('\n')
+                            clean_lines = [line for line in lines if '{' not in line and '}' not in line and '"' not in line and line.strip()]
+                            if clean_lines:
+                                cleaned_rationale = ' '.join(clean_lines)
+                                sentences = cleaned_rationale.split('.')
+                                reason_short = '. '.join(sentences[:2]).strip() + '.' if len(sentences) > 1 else cleaned_rationale[:140]
+                                reason_detailed = cleaned_rationale
+                            else:
+                                # Last resort: just use the original details field
+                                reason_short = f.details[:140]
+                                reason_detailed = f.details
+                    else:
+                        # No JSON detected, treat as plain text
+                        sentences = cleaned_rationale.split('.')
+                        reason_short = '. '.join(sentences[:2]).strip() + '.' if len(sentences) > 1 else cleaned_rationale[:140]
+                        reason_detailed = cleaned_rationale
 
-                    # Append to details WITHOUT the "LLM Analysis" prefix
-                    # Store full reason_short and reason_detailed in tags (don't truncate here - that causes JSON fragments to appear)
-                    f = Finding(
-                        rule_id=f.rule_id,
-                        passed=f.passed,
-                        details=f.details,  # Keep original details clean
-                        citations=f.citations,
-                        tags=getattr(f, "tags", []) + [f"llm_analysis_mode:{mode}", f"reason_short:{reason_short}", f"reason_detailed:{reason_detailed}"],
-                    )
+                # Append to details WITHOUT the "LLM Analysis" prefix
+                # Store full reason_short and reason_detailed in tags (don't truncate here - that causes JSON fragments to appear)
+                f = Finding(
+                    rule_id=f.rule_id,
+                    passed=f.passed,
+                    details=f.details,  # Keep original details clean
+                    citations=f.citations,
+                    tags=getattr(f, "tags", []) + [f"llm_analysis_mode:{mode}", f"reason_short:{reason_short}", f"reason_detailed:{reason_detailed}"],
+                )
+                return f, f"explanation_added_for={f.rule_id}"
+            return None, f"explanation_failed_for={f.rule_id}: {rationale[:100] if rationale else 'empty_response'}"
+        except Exception as e:
+            return None, f"explanation_error_for={f.rule_id}: {e!r}"
+
+    # Explanation calls are independent HTTP round trips, so run them concurrently
+    # (CE_MAX_WORKERS_EXTRACT threads). Work in waves of "explanations still needed"
+    # so - as before - a failed call lets the next failing finding take its slot.
+    from concurrent.futures import ThreadPoolExecutor
+
+    candidates = [i for i, f in enumerate(findings) if not f.passed and f.rule_id != "llm_explanations_status"]
+    updated = list(findings)
+    pos = 0
+    with ThreadPoolExecutor(max_workers=max(1, settings.CE_MAX_WORKERS_EXTRACT)) as ex:
+        while used < max_failures and pos < len(candidates):
+            batch = candidates[pos:pos + (max_failures - used)]
+            pos += len(batch)
+            for idx, (explained, msg) in zip(batch, ex.map(lambda i: _explain(findings[i]), batch)):
+                status.append(msg)
+                if explained is not None:
+                    updated[idx] = explained
                     used += 1
-                    status.append(f"explanation_added_for={f.rule_id}")
-                else:
-                    status.append(f"explanation_failed_for={f.rule_id}: {rationale[:100] if rationale else 'empty_response'}")
-            except Exception as e:
-                status.append(f"explanation_error_for={f.rule_id}: {e!r}")
-
-        updated.append(f)
 
     status.append(f"explanations_added={used}/{len(failed_findings)}")
     findings = updated
@@ -4285,8 +4413,6 @@ def _generate_llm_recommendations(
     Returns:
         Dict mapping check_id to recommendation text
     """
-    from infrastructure import settings
-
     # Check if LLM is enabled
     if not settings.get_llm_enabled():
         return {}
@@ -4340,12 +4466,11 @@ def _generate_llm_recommendations(
 
         # Parse JSON response
         import json
-        import re
 
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
+        json_block = _outer_braces(response)
+        if json_block:
             try:
-                recommendations_dict = json.loads(json_match.group(0))
+                recommendations_dict = json.loads(json_block)
                 # Clean up LLM prefixes from each recommendation
                 return {k: _clean_llm_prefix(v) for k, v in recommendations_dict.items() if isinstance(v, str)}
             except json.JSONDecodeError:
@@ -4945,8 +5070,6 @@ def render_report_markdown(report: DocumentReport) -> str:
     Returns:
         str: Formatted Markdown report
     """
-    from infrastructure import settings
-
     # Check if V2 rendering is enabled and available
     use_v2 = settings.USE_REPORT_V2
     has_v2 = hasattr(report, 'report_v2') and report.report_v2 is not None
@@ -5088,8 +5211,8 @@ def make_report(document_name: str, text: str, rules: RuleSet, pack_data: Option
     >>> print(f"Findings: {len(report.findings)}")
     >>> markdown = render_markdown(report)
     """
-    from infrastructure import settings, LeaseExtraction
-    from document_analysis import enhance_citations_with_page_line
+    from infrastructure import LeaseExtraction, CitationPool
+    from document_analysis import enhance_citations_with_page_line, PageLineMapper
 
     # ============================================================
     # PHASE 1: RESOLVE METADATA
@@ -5161,9 +5284,17 @@ def make_report(document_name: str, text: str, rules: RuleSet, pack_data: Option
         # Sub-phase 4a: Add page and line numbers to all citations
         # Converts character positions to page/line references using text layout
         # BUG 1b FIX: Process ALL findings, not just first
+        # One mapper per document: page/line boundaries are computed once, not per finding.
+        # Equal citations from different rules are pooled so the report shares one object each.
+        mapper = None
+        citation_pool = CitationPool()
         for finding in findings:
             if finding.citations:
-                finding.citations = enhance_citations_with_page_line(text, finding.citations)
+                if mapper is None:
+                    mapper = PageLineMapper(text)
+                finding.citations = citation_pool.intern_all(
+                    enhance_citations_with_page_line(text, finding.citations, mapper=mapper)
+                )
 
         # Sub-phase 4b: Guard against monetary false positives
         # Prevents "200 million shares" from being flagged as contract value
@@ -5481,19 +5612,20 @@ def render_markdown(report: DocumentReport) -> str:
     return "\n".join(lines)
 
 
-def save_markdown(report: DocumentReport, out_dir: Path):
-    """Save report as Markdown file using the V2 renderer (if enabled)."""
+def save_markdown(report: DocumentReport, out_dir: Path) -> str:
+    """Save report as Markdown file using the V2 renderer (if enabled); returns the Markdown."""
     out_dir.mkdir(parents=True, exist_ok=True)
     # Use the wrapper that respects USE_REPORT_V2 setting
     markdown_content = render_report_markdown(report)
     (out_dir / "report.md").write_text(markdown_content, encoding="utf-8")
+    return markdown_content
 
 
 def save_txt(report: DocumentReport, out_dir: Path):
     """Save report as JSON files."""
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "report.txt").write_text(report.model_dump_json(indent=2), encoding="utf-8")
-    (out_dir / "_eval_debug.json").write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    (out_dir / "report.txt").write_bytes(to_json_bytes(report, indent=True))
+    (out_dir / "_eval_debug.json").write_bytes(to_json_bytes(report, indent=True))
 
 
 # ========================================
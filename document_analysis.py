@@ -17,16 +17,24 @@ OCR Support:
 
 import re
 import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import pdfplumber
-import tempfile
 import os
 import io
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, NamedTuple, Union
+from typing import Dict, Iterator, List, Tuple, Optional, NamedTuple, Union
 from infrastructure import RulePack, Citation, settings
 
 try:
-    import fitz  # PyMuPDF
+    import fitz  # PyMuPDF - C text extraction; also rasterizes pages for OCR
+except ImportError:
+    fitz = None
+
+try:
     from PIL import Image
     import pytesseract
 
@@ -36,68 +44,128 @@ try:
         if os.path.exists(default_tesseract_path):
             pytesseract.pytesseract.tesseract_cmd = default_tesseract_path
 
-    OCR_AVAILABLE = True
+    OCR_AVAILABLE = fitz is not None
 except ImportError:
     OCR_AVAILABLE = False
-    fitz = None
     Image = None
     pytesseract = None
 
+logger = logging.getLogger(__name__)
+
 # Constants
 PAGE_BREAK = "\f"  # Keep page boundaries in the text
 OCR_THRESHOLD = 100  # Minimum characters to consider PDF as text-based (not scanned)
+TEXT_CACHE_SIZE = 256  # Extracted documents kept by _cached_text()
+
+# Extracted text keyed by content hash (uploads) or (path, mtime_ns, size) (files).
+# Re-analyzing the same PDF - reruns, retries, batch re-evaluation - skips extraction.
+_TEXT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_TEXT_CACHE_LOCK = threading.Lock()  # server handlers may extract from worker threads
+
+# PyMuPDF is not thread-safe: only one thread at a time may open, read or
+# render a document. Parallel extraction uses processes (see iter_ingest()).
+_FITZ_LOCK = threading.Lock()
 
 # ========================================
 # PDF TEXT EXTRACTION
 # ========================================
 
+def _cached_text(key: tuple, extract) -> str:
+    """Return cached text for key, or run extract() and cache its result (LRU)."""
+    with _TEXT_CACHE_LOCK:
+        text = _TEXT_CACHE.get(key)
+        if text is not None:
+            _TEXT_CACHE.move_to_end(key)
+            return text
+    text = extract()
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE[key] = text
+        if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    return text
+
+
+def _extract_one(pdf_path: Path) -> Tuple[str, str]:
+    """Extract one PDF for ingest_pdfs_from_directory(); returns (stem, text)."""
+    print(f"Reading {pdf_path.name}...")
+    # Use smart extraction (auto-detects scanned PDFs)
+    return pdf_path.stem, extract_text_with_pages(str(pdf_path))
+
+
+def iter_ingest() -> Iterator[Tuple[str, str]]:
+    """
+    Stream PDFs from the data/ directory as (stem, text) pairs.
+
+    Lets callers process each document as soon as it is extracted instead of
+    holding every document's text at once. Files are extracted in parallel
+    worker processes when settings.CE_MAX_WORKERS > 1 (results still arrive
+    in directory order).
+    """
+    # scandir: one syscall per entry, cached d_type, and catches ".PDF" too
+    try:
+        with os.scandir("data") as it:
+            pdf_paths = [
+                Path(e.path) for e in it
+                if e.name.lower().endswith(".pdf") and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return  # no data/ folder - nothing to ingest, same as the old glob()
+    workers = min(settings.CE_MAX_WORKERS, len(pdf_paths))
+    if workers <= 1:
+        yield from map(_extract_one, pdf_paths)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Processes for both backends: PyMuPDF is not thread-safe, and pdfminer is
+    # pure Python, so threads would be serialized by the GIL anyway
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(_extract_one, pdf_paths)
+
+
 def ingest_pdfs_from_directory() -> Dict[str, str]:
     """
     Ingest all PDFs from the data/ directory with automatic OCR detection.
     Returns dict mapping filename (without extension) to extracted text.
+
+    Prefer iter_ingest() when the documents don't all need to be in memory.
     """
-    pdf_folder = Path("data")
-    text_store = dict()
-    for pdf_path in pdf_folder.glob("*.pdf"):
-        title = pdf_path.name
-        print(f"Reading {title}...")
-        # Use smart extraction (auto-detects scanned PDFs)
-        full_text = extract_text_with_pages(str(pdf_path))
-        text_store[pdf_path.stem] = full_text
-    return text_store
+    return dict(iter_ingest())
 
 
 def ingest_bytes_to_text(data: bytes, filename: str | None = None) -> str:
     """
-    Accept raw PDF bytes, write to a temp file, extract text with automatic OCR detection,
+    Accept raw PDF bytes, extract text with automatic OCR detection,
     and return the combined string with form-feed page breaks.
 
+    The bytes are parsed in memory (PyMuPDF when available, pdfminer
+    otherwise); nothing is written to disk.
+
     Args:
         data: Raw PDF bytes
-        filename: Optional filename for proper extension handling
+        filename: Optional filename, used in progress output
 
     Returns:
         Extracted text with \f as page separators
     """
-    suffix = ""
-    if filename and "." in filename:
-        suffix = "." + filename.split(".")[-1]
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(data)
-        tmp_path = tmp.name
+    key = ("bytes", hashlib.blake2b(data, digest_size=16).digest())
+    return _cached_text(key, lambda: _ingest_bytes_uncached(data, filename))
 
-    try:
-        # Use smart extraction with OCR detection
-        return extract_text_with_pages(tmp_path)
-    finally:
-        try:
-            os.remove(tmp_path)
-        except Exception:
-            pass
 
+def _ingest_bytes_uncached(data: bytes, filename: str | None) -> str:
+    if fitz is not None:
+        # PyMuPDF reads straight from memory - no temp file round trip
+        return _extract_text_fitz(data, label=filename or "<bytes>")
+
+    # pdfminer reads file-like objects too. OCR needs PyMuPDF, so without it
+    # there's no scanned-PDF branch to take here.
+    print(f"Extracting text from text-based PDF: {filename or '<bytes>'}")
+    return _extract_text_pdfminer(io.BytesIO(data))
 
-# Alias for backward compatibility
+
+# Aliases for backward compatibility
 ingest = ingest_pdfs_from_directory
+ingest_all = ingest_pdfs_from_directory
 
 
 def is_scanned_pdf(pdf_path: str, threshold: int = OCR_THRESHOLD) -> bool:
@@ -131,13 +199,43 @@ def is_scanned_pdf(pdf_path: str, threshold: int = OCR_THRESHOLD) -> bool:
         return True
 
 
-def extract_text_with_ocr(pdf_path: str, lang: str = 'eng') -> str:
+def _open_fitz(source: Union[str, bytes]):
+    """Open a PDF with PyMuPDF from a path or raw bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _extract_text_fitz(source: Union[str, bytes], label: str) -> str:
+    """
+    Extract page text with PyMuPDF, falling back to OCR for scanned PDFs.
+
+    Scanned detection uses the same rule as is_scanned_pdf() (first 3 pages
+    under OCR_THRESHOLD characters), applied to the text already extracted,
+    so the document is parsed once.
+    """
+    with _FITZ_LOCK:
+        doc = _open_fitz(source)
+        try:
+            pages = [doc.load_page(i).get_text("text").strip() for i in range(doc.page_count)]
+        finally:
+            doc.close()
+
+    if OCR_AVAILABLE and sum(len(p) for p in pages[:3]) < OCR_THRESHOLD:
+        return extract_text_with_ocr(source, label=label)
+
+    print(f"Extracting text from text-based PDF: {label}")
+    return PAGE_BREAK.join(pages)
+
+
+def extract_text_with_ocr(pdf_path: Union[str, bytes], lang: str = 'eng', label: Optional[str] = None) -> str:
     """
     Extract text from a scanned PDF using OCR (PyMuPDF + Tesseract).
 
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or raw PDF bytes
         lang: Tesseract language code (default: 'eng')
+        label: Name to show in progress output (defaults to pdf_path)
 
     Returns:
         Extracted text with page breaks
@@ -148,37 +246,38 @@ def extract_text_with_ocr(pdf_path: str, lang: str = 'eng') -> str:
             "pip install PyMuPDF Pillow pytesseract"
         )
 
-    print(f"Using OCR to extract text from scanned PDF: {pdf_path}")
+    print(f"Using OCR to extract text from scanned PDF: {label or pdf_path}")
 
-    # Open the PDF with PyMuPDF
-    pdf_document = fitz.open(pdf_path)
-    pages = []
+    with _FITZ_LOCK:
+        # Open the PDF with PyMuPDF
+        pdf_document = _open_fitz(pdf_path)
+        pages = []
 
-    # Process each page
-    for page_num in range(len(pdf_document)):
-        print(f"  OCR processing page {page_num + 1}/{len(pdf_document)}...")
+        # Process each page
+        for page_num in range(len(pdf_document)):
+            logger.debug("OCR processing page %d/%d", page_num + 1, len(pdf_document))
 
-        # Get the page
-        page = pdf_document[page_num]
+            # Get the page
+            page = pdf_document[page_num]
 
-        # Convert page to image with higher resolution for better OCR
-        # 2.0 matrix = 2x resolution (better quality)
-        mat = fitz.Matrix(2.0, 2.0)
-        pix = page.get_pixmap(matrix=mat)
+            # Convert page to image with higher resolution for better OCR
+            # 2.0 matrix = 2x resolution (better quality)
+            mat = fitz.Matrix(2.0, 2.0)
+            pix = page.get_pixmap(matrix=mat)
 
-        # Convert pixmap to PIL Image
-        img_data = pix.tobytes("png")
-        img = Image.open(io.BytesIO(img_data))
+            # Convert pixmap to PIL Image
+            img_data = pix.tobytes("png")
+            img = Image.open(io.BytesIO(img_data))
 
-        # Perform OCR on the image
-        text = pytesseract.image_to_string(img, lang=lang)
-        pages.append(text.strip())
+            # Perform OCR on the image
+            text = pytesseract.image_to_string(img, lang=lang)
+            pages.append(text.strip())
 
-        # Clean up
-        pix = None
+            # Clean up
+            pix = None
 
-    # Close the document
-    pdf_document.close()
+        # Close the document
+        pdf_document.close()
 
     # Join pages with PAGE_BREAK character
     return PAGE_BREAK.join(pages)
@@ -187,7 +286,8 @@ def extract_text_with_ocr(pdf_path: str, lang: str = 'eng') -> str:
 def extract_text_with_pages(pdf_path: str) -> str:
     """
     Extract text from PDF with automatic scanned PDF detection.
-    Uses OCR if the PDF is scanned, otherwise uses normal text extraction.
+    Uses OCR if the PDF is scanned, otherwise uses normal text extraction
+    (PyMuPDF when installed, pdfminer otherwise).
 
     Args:
         pdf_path: Path to the PDF file
@@ -195,6 +295,18 @@ def extract_text_with_pages(pdf_path: str) -> str:
     Returns:
         Extracted text with page breaks (\\f separators)
     """
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return _extract_path_uncached(pdf_path)  # let the PDF library raise its usual error
+    key = ("path", os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
+    return _cached_text(key, lambda: _extract_path_uncached(pdf_path))
+
+
+def _extract_path_uncached(pdf_path: str) -> str:
+    if fitz is not None:
+        return _extract_text_fitz(pdf_path, label=pdf_path)
+
     # Check if PDF is scanned
     if OCR_AVAILABLE and is_scanned_pdf(pdf_path):
         # Use OCR for scanned PDFs
@@ -202,12 +314,24 @@ def extract_text_with_pages(pdf_path: str) -> str:
     else:
         # Use normal text extraction for text-based PDFs
         print(f"Extracting text from text-based PDF: {pdf_path}")
-        pages = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                pages.append(text.strip())
-        return PAGE_BREAK.join(pages)
+        return _extract_text_pdfminer(pdf_path)
+
+
+def _extract_text_pdfminer(source: Union[str, io.BytesIO]) -> str:
+    """
+    Extract page text with pdfminer.six from a path or file-like object.
+
+    Calls pdfminer directly rather than through pdfplumber, which builds
+    per-character objects on every page before clustering them into text.
+    pdfminer's text converter already ends each page with a form feed.
+    """
+    from pdfminer.high_level import extract_text
+    from pdfminer.layout import LAParams
+
+    pages = extract_text(source, laparams=LAParams()).split(PAGE_BREAK)
+    if pages and not pages[-1]:
+        pages.pop()  # empty piece after the final page's form feed
+    return PAGE_BREAK.join(p.strip() for p in pages)
 
 
 # ========================================
@@ -348,24 +472,28 @@ class PageLineMapper:
         if page is None or line_start is None:
             confidence = 0.5  # Lower confidence if we couldn't map properly
 
-        return Citation(
-            char_start=citation.char_start,
-            char_end=citation.char_end,
-            quote=citation.quote,
-            page=page,
-            line_start=line_start,
-            line_end=line_end,
-            confidence=confidence
-        )
+        # Fields are already validated on the source citation; copy without re-validating
+        return citation.model_copy(update={
+            "page": page,
+            "line_start": line_start,
+            "line_end": line_end,
+            "confidence": confidence,
+        })
 
 
-def enhance_citations_with_page_line(text: str, citations: List[Citation]) -> List[Citation]:
+def enhance_citations_with_page_line(
+    text: str,
+    citations: List[Citation],
+    mapper: Optional[PageLineMapper] = None,
+) -> List[Citation]:
     """
     Enhance a list of citations with page and line information.
 
     Args:
         text: Document text with page breaks
         citations: List of citations to enhance
+        mapper: Optional pre-built mapper for `text` (reuse it across findings
+                of the same document to avoid re-splitting the text)
 
     Returns:
         List of enhanced citations
@@ -373,7 +501,8 @@ def enhance_citations_with_page_line(text: str, citations: List[Citation]) -> Li
     if not citations:
         return citations
 
-    mapper = PageLineMapper(text)
+    if mapper is None:
+        mapper = PageLineMapper(text)
     return [mapper.enhance_citation(citation) for citation in citations]
 
 
@@ -381,6 +510,17 @@ def enhance_citations_with_page_line(text: str, citations: List[Citation]) -> Li
 # DOCUMENT TYPE DETECTION
 # ========================================
 
+_TITLE_WS_RE = re.compile(r'\s+')
+_TITLE_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=1024)
+def _word_pattern(phrase: str, escape: bool = True) -> re.Pattern:
+    """Case-insensitive whole-word pattern for a title/keyword, compiled once."""
+    body = re.escape(phrase) if escape else phrase
+    return re.compile(rf"\b{body}\b", re.IGNORECASE)
+
+
 class DocTypeCandidate(NamedTuple):
     """A candidate document type with confidence score."""
     pack_id: str
@@ -443,6 +583,16 @@ class DocumentClassifier:
             r"joint\s+venture": 3.5,
         }
 
+        # Compiled once; these signals don't depend on the pack being scored
+        self._keyword_patterns = [
+            (keyword, _word_pattern(keyword), weight)
+            for keyword, weight in self.keyword_weights.items()
+        ]
+        self._section_patterns = [
+            (pattern, re.compile(pattern, re.IGNORECASE), weight)
+            for pattern, weight in self.section_patterns.items()
+        ]
+
     def normalize_and_dedupe_titles(self, packs: Dict[str, RulePack]) -> Dict[str, List[str]]:
         """Normalize and deduplicate document type names."""
         normalized = {}
@@ -451,8 +601,8 @@ class DocumentClassifier:
             seen = set()
             for name in pack.doc_type_names:
                 # Normalize: lowercase, remove extra spaces, standardize punctuation
-                norm = re.sub(r'\s+', ' ', name.lower().strip())
-                norm = re.sub(r'[^\w\s]', '', norm)  # Remove punctuation
+                norm = _TITLE_WS_RE.sub(' ', name.lower().strip())
+                norm = _TITLE_PUNCT_RE.sub('', norm)  # Remove punctuation
                 if norm not in seen and norm:
                     titles.append(norm)
                     seen.add(norm)
@@ -470,41 +620,47 @@ class DocumentClassifier:
         candidates = []
         normalized_titles = self.normalize_and_dedupe_titles(packs)
 
+        # Keyword, section-header and length signals are the same for every
+        # pack, so scan the head for them once rather than once per pack.
+        shared_score = 0.0
+        shared_reasons = []
+
+        # 2. Keyword scoring
+        for keyword, keyword_pattern, weight in self._keyword_patterns:
+            matches = len(keyword_pattern.findall(head))
+            if matches > 0:
+                keyword_score = matches * weight
+                shared_score += keyword_score
+                shared_reasons.append(f"keyword({keyword}): {keyword_score:.1f}")
+
+        # 3. Section header patterns (medium-high weight)
+        for pattern, section_pattern, weight in self._section_patterns:
+            section_matches = len(section_pattern.findall(head))
+            if section_matches > 0:
+                section_score = section_matches * weight
+                shared_score += section_score
+                shared_reasons.append(f"section({pattern}): {section_score:.1f}")
+
+        # 4. Document length bonus (longer docs more likely to be complex agreements)
+        length_bonus = min(len(text) / 10000, 1.0)  # Cap at 1.0
+        shared_score += length_bonus
+        if length_bonus > 0.1:
+            shared_reasons.append(f"length_bonus: {length_bonus:.1f}")
+
         for pack_id, pack in packs.items():
             total_score = 0.0
             reasons = []
 
             # 1. Direct title matching (highest weight)
             for title in normalized_titles[pack_id]:
-                title_pattern = re.compile(rf'\b{re.escape(title)}\b', re.IGNORECASE)
-                matches = len(title_pattern.findall(head))
+                matches = len(_word_pattern(title).findall(head))
                 if matches > 0:
                     title_score = matches * 5.0  # High weight for exact title matches
                     total_score += title_score
                     reasons.append(f"title_match({title}): {title_score:.1f}")
 
-            # 2. Keyword scoring
-            for keyword, weight in self.keyword_weights.items():
-                keyword_pattern = re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE)
-                matches = len(keyword_pattern.findall(head))
-                if matches > 0:
-                    keyword_score = matches * weight
-                    total_score += keyword_score
-                    reasons.append(f"keyword({keyword}): {keyword_score:.1f}")
-
-            # 3. Section header patterns (medium-high weight)
-            for pattern, weight in self.section_patterns.items():
-                section_matches = len(re.findall(pattern, head, re.IGNORECASE))
-                if section_matches > 0:
-                    section_score = section_matches * weight
-                    total_score += section_score
-                    reasons.append(f"section({pattern}): {section_score:.1f}")
-
-            # 4. Document length bonus (longer docs more likely to be complex agreements)
-            length_bonus = min(len(text) / 10000, 1.0)  # Cap at 1.0
-            total_score += length_bonus
-            if length_bonus > 0.1:
-                reasons.append(f"length_bonus: {length_bonus:.1f}")
+            total_score += shared_score
+            reasons.extend(shared_reasons)
 
             # Normalize score by number of doc types for this pack
             if len(pack.doc_type_names) > 1:
@@ -650,7 +806,7 @@ def compile_title_hints(packs: Dict[str, RulePack]) -> List[Tuple[re.Pattern, st
     hints: List[Tuple[re.Pattern, str]] = []
     for pack in packs.values():
         for name in pack.doc_type_names:
-            hints.append((re.compile(rf"\b{name}\b", re.IGNORECASE), pack.id))
+            hints.append((_word_pattern(name, escape=False), pack.id))
     return hints
 
 
@@ -673,8 +829,10 @@ def guess_doc_type_id(text: str, packs: Dict[str, RulePack]) -> Optional[str]:
 __all__ = [
     # PDF Ingestion (with OCR support)
     'ingest_pdfs_from_directory',
+    'iter_ingest',  # streaming variant
     'ingest_bytes_to_text',
     'ingest',  # alias
+    'ingest_all',  # alias
     'extract_text_with_pages',  # Smart extraction with OCR detection
     'extract_text_with_ocr',  # Manual OCR extraction
     'is_scanned_pdf',  # Scanned PDF detection
@@ -692,5 +850,6 @@ __all__ = [
     # Constants
     'PAGE_BREAK',
     'OCR_THRESHOLD',
+    'TEXT_CACHE_SIZE',
     'OCR_AVAILABLE'
 ]
\ No newline at end of file
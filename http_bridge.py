@@ -6,12 +6,13 @@ Wraps MCP stdio tools as REST API endpoints for frontend consumption
 Runs alongside the stdio MCP server for LibreChat integration
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from pydantic import BaseModel, ValidationError
+from typing import Optional, List, Dict, Any, Type, TypeVar
 import logging
+import orjson
 from pathlib import Path
 import tempfile
 import asyncio
@@ -62,7 +63,9 @@ log = logging.getLogger("contractextract.http_bridge")
 app = FastAPI(
     title="ContractExtract HTTP Bridge",
     description="REST API bridge to MCP stdio tools",
-    version="1.0.0"
+    version="1.0.0",
+    # Encode every JSON response with orjson instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration for frontend
@@ -93,6 +96,28 @@ class PreviewAnalysisRequest(BaseModel):
     document_text: str
     pack_id: Optional[str] = None
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+async def _parse_body(request: Request, model: Type[_ModelT]) -> _ModelT:
+    """
+    Decode a JSON request body with orjson and validate it into model.
+
+    Used by the endpoints that carry whole documents or rule packs in the
+    body, where FastAPI's default stdlib json.loads is the parsing hot spot.
+    """
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {e}")
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+def _json_body_doc(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a body read by _parse_body() (FastAPI can't see it)."""
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": model.model_json_schema()}}}}
+
 # ========================================
 # RULE PACK ENDPOINTS
 # ========================================
@@ -154,9 +179,10 @@ async def get_rule_pack_yaml(pack_id: str, version: int):
         log.error(f"Error getting rule pack YAML: {e}")
         raise HTTPException(status_code=404, detail=str(e))
 
-@app.post("/rule-packs/import-yaml")
-async def import_yaml_text(request: YamlImportRequest):
+@app.post("/rule-packs/import-yaml", openapi_extra=_json_body_doc(YamlImportRequest))
+async def import_yaml_text(http_request: Request):
     """Create a new rule pack from YAML text"""
+    request = await _parse_body(http_request, YamlImportRequest)
     log.info(f"POST /rule-packs/import-yaml called (yaml length={len(request.yaml_text)} chars)")
     try:
         result = await handle_create_rulepack_from_yaml({
@@ -295,15 +321,17 @@ async def preview_run(file: UploadFile = File(...), pack_id: Optional[str] = For
         log.error(f"Error in preview run: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/preview-analysis")
-async def preview_analysis(request: PreviewAnalysisRequest):
+@app.post("/preview-analysis", openapi_extra=_json_body_doc(PreviewAnalysisRequest))
+async def preview_analysis(http_request: Request):
     """Quick preview analysis from text without saving files"""
+    request = await _parse_body(http_request, PreviewAnalysisRequest)
     try:
         result = await handle_preview_document_analysis({
             "document_text": request.document_text,
             "pack_id": request.pack_id
         })
-        return result
+        # Plain JSON-native dict: skip FastAPI's jsonable_encoder walk
+        return ORJSONResponse(content=result)
     except Exception as e:
         log.error(f"Error in preview analysis: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -325,9 +353,10 @@ async def generate_template(pack_id: str, doc_type_names: List[str]):
         log.error(f"Error generating template: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/rule-packs/validate-yaml")
-async def validate_yaml(request: YamlImportRequest):
+@app.post("/rule-packs/validate-yaml", openapi_extra=_json_body_doc(YamlImportRequest))
+async def validate_yaml(http_request: Request):
     """Validate YAML content before creating/updating rule packs"""
+    request = await _parse_body(http_request, YamlImportRequest)
     try:
         result = await handle_validate_rulepack_yaml({"yaml_content": request.yaml_text})
         return result
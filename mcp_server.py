@@ -6,12 +6,23 @@ Replaces mcp_server.py FastMCP implementation for Phase 3
 """
 
 import asyncio
+import atexit
+import functools
 import json
 import logging
 import os
+import re
 import hashlib
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Mapping, Optional, Union
+
+import orjson
+import yaml
+from sqlalchemy import delete, func, lambda_stmt, select, update
 
 # MCP stdio server imports
 from mcp.server import Server
@@ -19,9 +30,9 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 
 # Import business logic
-from infrastructure import SessionLocal, init_db, RulePack as RuntimeRulePack, RuleSet, ExampleItem
-from rulepack_manager import load_packs_for_runtime, RulePackRecord, import_rulepack_yaml, publish_pack, RulePackRead, RulePackUpdate
-from document_analysis import ingest_bytes_to_text, guess_doc_type_id
+from infrastructure import SessionLocal, init_db, settings, DATABASE_URL, RulePack as RuntimeRulePack, RuleSet, ExampleItem
+from rulepack_manager import load_packs_for_runtime, RulePackRecord, import_rulepack_yaml, publish_pack, RulePackRead, RulePackUpdate, _YamlLoader
+from document_analysis import extract_text_with_pages, guess_doc_type_id
 from contract_analyzer import make_report, save_markdown, save_txt
 
 # Set up logging
@@ -38,235 +49,382 @@ server = Server("ContractExtract")
 # TOOL DEFINITIONS (Pure stdio MCP)
 # ========================================
 
+# Schema fragments shared by several tools (by reference, not copied)
+_PACK_ID_PROP = {"type": "string", "description": "Rule pack identifier"}
+_VERSION_PROP = {"type": "integer", "description": "Version number"}
+_LATEST_VERSION_PROP = {"type": "integer", "description": "Version number (optional, defaults to latest)"}
+_PACK_VERSION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "pack_id": _PACK_ID_PROP,
+        "version": _VERSION_PROP
+    },
+    "required": ["pack_id", "version"]
+}
+
+# Tool schemas are static: build the Tool objects once at import time
+_TOOLS_CACHE: List[Tool] = [
+    # Rule Pack Management Tools
+    Tool(
+        name="list_all_rulepacks",
+        description="List ALL rule packs in the database (any status/version) with detailed information",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_active_rulepacks",
+        description="List only active rule packs available for document analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_rulepack_details",
+        description="Get detailed information for a specific rule pack version",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": _PACK_ID_PROP,
+                "version": _LATEST_VERSION_PROP
+            },
+            "required": ["pack_id"]
+        }
+    ),
+    Tool(
+        name="get_rulepack_yaml",
+        description="Get the raw YAML content for a rule pack",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": _PACK_ID_PROP,
+                "version": _LATEST_VERSION_PROP
+            },
+            "required": ["pack_id"]
+        }
+    ),
+    Tool(
+        name="list_rulepack_versions",
+        description="List all versions for a given rule pack id",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": _PACK_ID_PROP
+            },
+            "required": ["pack_id"]
+        }
+    ),
+
+    # Rule Pack Creation/Editing Tools
+    Tool(
+        name="create_rulepack_from_yaml",
+        description="Create a new rule pack from YAML content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "yaml_content": {"type": "string", "description": "Complete YAML rule pack definition"},
+                "created_by": {"type": "string", "description": "Creator identifier (optional)", "default": "mcp-llm"}
+            },
+            "required": ["yaml_content"]
+        }
+    ),
+    Tool(
+        name="update_rulepack_yaml",
+        description="Update a draft rule pack with new YAML content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": _PACK_ID_PROP,
+                "version": _VERSION_PROP,
+                "yaml_content": {"type": "string", "description": "Updated YAML content"}
+            },
+            "required": ["pack_id", "version", "yaml_content"]
+        }
+    ),
+    Tool(
+        name="publish_rulepack",
+        description="Publish a draft rule pack to make it active",
+        inputSchema=_PACK_VERSION_SCHEMA
+    ),
+    Tool(
+        name="deprecate_rulepack",
+        description="Deprecate an active rule pack",
+        inputSchema=_PACK_VERSION_SCHEMA
+    ),
+    Tool(
+        name="delete_rulepack",
+        description="Delete a rule pack version (use with caution)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": _PACK_ID_PROP,
+                "version": _VERSION_PROP,
+                "force": {"type": "boolean", "description": "Force delete non-draft packs", "default": False}
+            },
+            "required": ["pack_id", "version"]
+        }
+    ),
+
+    # Document Analysis Tools
+    Tool(
+        name="analyze_document",
+        description="Analyze a contract document using rule packs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_path": {"type": "string", "description": "Path to document file (optional)"},
+                "document_text": {"type": "string", "description": "Document text content (optional)"},
+                "doc_type_hint": {"type": "string", "description": "Document type hint (optional)"},
+                "pack_id": {"type": "string", "description": "Specific rule pack to use (optional)"}
+            },
+            "oneOf": [
+                {"required": ["document_path"]},
+                {"required": ["document_text"]}
+            ]
+        }
+    ),
+    Tool(
+        name="preview_document_analysis",
+        description="Quick preview analysis without saving files",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_text": {"type": "string", "description": "Document text content"},
+                "pack_id": {"type": "string", "description": "Specific rule pack to use (optional)"}
+            },
+            "required": ["document_text"]
+        }
+    ),
+
+    # Utility Tools
+    Tool(
+        name="generate_rulepack_template",
+        description="Generate a YAML template for creating new rule packs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pack_id": {"type": "string", "description": "Identifier for the new rule pack"},
+                "doc_type_names": {"type": "array", "items": {"type": "string"}, "description": "Document types this pack handles"}
+            },
+            "required": ["pack_id", "doc_type_names"]
+        }
+    ),
+    Tool(
+        name="validate_rulepack_yaml",
+        description="Validate YAML content before creating/updating rule packs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "yaml_content": {"type": "string", "description": "YAML content to validate"}
+            },
+            "required": ["yaml_content"]
+        }
+    ),
+    Tool(
+        name="get_system_info",
+        description="Get system information for debugging and monitoring",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+# ========================================
+# RESULT CACHE (read-only tools)
+# ========================================
+
+# Serialized responses of tools whose output depends only on their arguments and
+# the stored rule packs. Any handler that changes rule packs clears it.
+_CACHEABLE_TOOLS = frozenset({
+    "list_all_rulepacks",
+    "list_active_rulepacks",
+    "get_rulepack_details",
+    "get_rulepack_yaml",
+    "list_rulepack_versions",
+    "generate_rulepack_template",
+    "validate_rulepack_yaml",
+})
+RESULT_CACHE_SIZE = 256
+_RESULT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a JSON-like argument value."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+# Responses larger than this are sent compact; indentation is only a reading aid
+PRETTY_JSON_MAX_BYTES = 16 * 1024
+
+def _dumps(obj: Any) -> str:
+    """JSON for tool responses (orjson; str() for anything it can't encode).
+
+    Small responses are indented for readability; anything over
+    PRETTY_JSON_MAX_BYTES compact is returned as-is.
+    """
+    compact = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    if len(compact) > PRETTY_JSON_MAX_BYTES:
+        return compact.decode()
+    return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+# Shared read-only stand-in for "no arguments" (handlers only read args)
+_EMPTY_ARGS: Mapping[str, Any] = types.MappingProxyType({})
+
+# get_system_info is polled; serve a prebuilt response for a few seconds
+SYSINFO_TTL_SECONDS = 5.0
+_SYSINFO_CACHE: Optional[tuple] = None  # (monotonic time, [TextContent])
+
+# Active runtime packs, reused until the rule pack epoch moves
+_RULEPACK_EPOCH = 0
+_RUNTIME_PACKS: Optional[tuple] = None  # (epoch, {pack_id: RuntimeRulePack})
+
+# The HTTP bridge and seed_database.py write rule_packs from other processes,
+# so the epoch also moves when the table's fingerprint (row count, newest
+# updated_at) changes. The fingerprint is re-read at most this often.
+RULEPACK_FINGERPRINT_TTL_SECONDS = 2.0
+_RULEPACK_FINGERPRINT: Optional[tuple] = None  # (monotonic time read, fingerprint)
+
+def _invalidate_rulepack_caches() -> None:
+    """Drop cached tool results and runtime packs after any rule pack write."""
+    global _RULEPACK_EPOCH
+    _RULEPACK_EPOCH += 1
+    _RESULT_CACHE.clear()
+    _DOC_TYPE_GUESSES.clear()
+
+def _rulepack_fingerprint_is_fresh(now: float) -> bool:
+    seen = _RULEPACK_FINGERPRINT
+    return seen is not None and now - seen[0] < RULEPACK_FINGERPRINT_TTL_SECONDS
+
+def _read_rulepack_fingerprint(db=None) -> tuple:
+    """(row count, newest updated_at) of rule_packs."""
+    stmt = select(func.count(), func.max(RulePackRecord.updated_at))
+    if db is None:
+        with SessionLocal() as session:
+            return tuple(session.execute(stmt).one())
+    return tuple(db.execute(stmt).one())
+
+def _note_rulepack_fingerprint(now: float, fingerprint: tuple) -> None:
+    """Record a fingerprint read at now, invalidating the caches if it changed."""
+    global _RULEPACK_FINGERPRINT
+    seen = _RULEPACK_FINGERPRINT
+    if seen is None or seen[1] != fingerprint:
+        _invalidate_rulepack_caches()
+    _RULEPACK_FINGERPRINT = (now, fingerprint)
+
+def _sync_rulepack_epoch(db) -> None:
+    """Invalidate the rule pack caches if rule_packs changed outside this process."""
+    now = time.monotonic()
+    if not _rulepack_fingerprint_is_fresh(now):
+        _note_rulepack_fingerprint(now, _read_rulepack_fingerprint(db))
+
+async def _sync_rulepack_epoch_async() -> None:
+    """_sync_rulepack_epoch() for call_tool: the DB read runs in a worker thread."""
+    now = time.monotonic()
+    if not _rulepack_fingerprint_is_fresh(now):
+        fingerprint = await asyncio.to_thread(_read_rulepack_fingerprint)
+        _note_rulepack_fingerprint(now, fingerprint)
+
+def _runtime_packs(db, pack_ids=()) -> Dict[str, RuntimeRulePack]:
+    """
+    Active runtime packs, loaded once per rule pack epoch.
+
+    With pack_ids, returns just the named packs that are active, or every
+    active pack when none of them match.
+    """
+    global _RUNTIME_PACKS
+    _sync_rulepack_epoch(db)
+    cached = _RUNTIME_PACKS
+    if cached is None or cached[0] != _RULEPACK_EPOCH:
+        cached = _RUNTIME_PACKS = (_RULEPACK_EPOCH, load_packs_for_runtime(db))
+    packs = cached[1]
+    selected = {p: packs[p] for p in pack_ids if p and p in packs}
+    # Callers may mutate their dict; never hand out the cached one
+    return selected or dict(packs)
+
+# guess_doc_type_id results for recently analyzed texts (rule pack iteration
+# re-analyzes the same document); keyed by content digest, epoch and pack ids
+DOC_TYPE_GUESS_CACHE_SIZE = 256
+_DOC_TYPE_GUESSES: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+
+def _guess_doc_type(text: str, packs_dict: Dict[str, RuntimeRulePack]) -> Optional[str]:
+    """guess_doc_type_id(), memoized per (text digest, rule pack epoch, pack ids)."""
+    key = (
+        hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+        _RULEPACK_EPOCH,
+        tuple(packs_dict),
+    )
+    if key in _DOC_TYPE_GUESSES:
+        _DOC_TYPE_GUESSES.move_to_end(key)
+        return _DOC_TYPE_GUESSES[key]
+    guessed_id = guess_doc_type_id(text, packs_dict)
+    _DOC_TYPE_GUESSES[key] = guessed_id
+    if len(_DOC_TYPE_GUESSES) > DOC_TYPE_GUESS_CACHE_SIZE:
+        _DOC_TYPE_GUESSES.popitem(last=False)
+    return guessed_id
+
+# Required argument names per tool, taken from the static schemas once
+_REQUIRED_ARGS: Dict[str, tuple] = {
+    t.name: tuple(t.inputSchema.get("required", ())) for t in _TOOLS_CACHE
+}
+
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List all available MCP tools for LibreChat."""
-    return [
-        # Rule Pack Management Tools
-        Tool(
-            name="list_all_rulepacks",
-            description="List ALL rule packs in the database (any status/version) with detailed information",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_active_rulepacks",
-            description="List only active rule packs available for document analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_rulepack_details",
-            description="Get detailed information for a specific rule pack version",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number (optional, defaults to latest)"}
-                },
-                "required": ["pack_id"]
-            }
-        ),
-        Tool(
-            name="get_rulepack_yaml",
-            description="Get the raw YAML content for a rule pack",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number (optional, defaults to latest)"}
-                },
-                "required": ["pack_id"]
-            }
-        ),
-        Tool(
-            name="list_rulepack_versions",
-            description="List all versions for a given rule pack id",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"}
-                },
-                "required": ["pack_id"]
-            }
-        ),
-
-        # Rule Pack Creation/Editing Tools
-        Tool(
-            name="create_rulepack_from_yaml",
-            description="Create a new rule pack from YAML content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "yaml_content": {"type": "string", "description": "Complete YAML rule pack definition"},
-                    "created_by": {"type": "string", "description": "Creator identifier (optional)", "default": "mcp-llm"}
-                },
-                "required": ["yaml_content"]
-            }
-        ),
-        Tool(
-            name="update_rulepack_yaml",
-            description="Update a draft rule pack with new YAML content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number"},
-                    "yaml_content": {"type": "string", "description": "Updated YAML content"}
-                },
-                "required": ["pack_id", "version", "yaml_content"]
-            }
-        ),
-        Tool(
-            name="publish_rulepack",
-            description="Publish a draft rule pack to make it active",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number"}
-                },
-                "required": ["pack_id", "version"]
-            }
-        ),
-        Tool(
-            name="deprecate_rulepack",
-            description="Deprecate an active rule pack",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number"}
-                },
-                "required": ["pack_id", "version"]
-            }
-        ),
-        Tool(
-            name="delete_rulepack",
-            description="Delete a rule pack version (use with caution)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Rule pack identifier"},
-                    "version": {"type": "integer", "description": "Version number"},
-                    "force": {"type": "boolean", "description": "Force delete non-draft packs", "default": False}
-                },
-                "required": ["pack_id", "version"]
-            }
-        ),
-
-        # Document Analysis Tools
-        Tool(
-            name="analyze_document",
-            description="Analyze a contract document using rule packs",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_path": {"type": "string", "description": "Path to document file (optional)"},
-                    "document_text": {"type": "string", "description": "Document text content (optional)"},
-                    "doc_type_hint": {"type": "string", "description": "Document type hint (optional)"},
-                    "pack_id": {"type": "string", "description": "Specific rule pack to use (optional)"}
-                },
-                "oneOf": [
-                    {"required": ["document_path"]},
-                    {"required": ["document_text"]}
-                ]
-            }
-        ),
-        Tool(
-            name="preview_document_analysis",
-            description="Quick preview analysis without saving files",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_text": {"type": "string", "description": "Document text content"},
-                    "pack_id": {"type": "string", "description": "Specific rule pack to use (optional)"}
-                },
-                "required": ["document_text"]
-            }
-        ),
-
-        # Utility Tools
-        Tool(
-            name="generate_rulepack_template",
-            description="Generate a YAML template for creating new rule packs",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pack_id": {"type": "string", "description": "Identifier for the new rule pack"},
-                    "doc_type_names": {"type": "array", "items": {"type": "string"}, "description": "Document types this pack handles"}
-                },
-                "required": ["pack_id", "doc_type_names"]
-            }
-        ),
-        Tool(
-            name="validate_rulepack_yaml",
-            description="Validate YAML content before creating/updating rule packs",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "yaml_content": {"type": "string", "description": "YAML content to validate"}
-                },
-                "required": ["yaml_content"]
-            }
-        ),
-        Tool(
-            name="get_system_info",
-            description="Get system information for debugging and monitoring",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+    return _TOOLS_CACHE
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any] | None = None) -> List[TextContent]:
     """Handle tool calls from LibreChat."""
+    global _SYSINFO_CACHE
     try:
-        args = arguments or {}
-        log.info(f"MCP stdio call_tool: {name} with args: {list(args.keys())}")
-
-        # Route to appropriate handler function
-        if name == "list_all_rulepacks":
-            result = await handle_list_all_rulepacks()
-        elif name == "list_active_rulepacks":
-            result = await handle_list_active_rulepacks()
-        elif name == "get_rulepack_details":
-            result = await handle_get_rulepack_details(args)
-        elif name == "get_rulepack_yaml":
-            result = await handle_get_rulepack_yaml(args)
-        elif name == "list_rulepack_versions":
-            result = await handle_list_rulepack_versions(args)
-        elif name == "create_rulepack_from_yaml":
-            result = await handle_create_rulepack_from_yaml(args)
-        elif name == "update_rulepack_yaml":
-            result = await handle_update_rulepack_yaml(args)
-        elif name == "publish_rulepack":
-            result = await handle_publish_rulepack(args)
-        elif name == "deprecate_rulepack":
-            result = await handle_deprecate_rulepack(args)
-        elif name == "delete_rulepack":
-            result = await handle_delete_rulepack(args)
-        elif name == "analyze_document":
-            result = await handle_analyze_document(args)
-        elif name == "preview_document_analysis":
-            result = await handle_preview_document_analysis(args)
-        elif name == "generate_rulepack_template":
-            result = await handle_generate_rulepack_template(args)
-        elif name == "validate_rulepack_yaml":
-            result = await handle_validate_rulepack_yaml(args)
-        elif name == "get_system_info":
-            result = await handle_get_system_info()
+        if name == "get_system_info":
+            now = time.monotonic()
+            cached = _SYSINFO_CACHE
+            if cached and now - cached[0] < SYSINFO_TTL_SECONDS:
+                return cached[1]
+            content = [TextContent(type="text", text=_dumps(await handle_get_system_info()))]
+            _SYSINFO_CACHE = (now, content)
+            return content
+
+        if name in _NOARG_TOOLS:
+            # Handler ignores arguments: no binding, no freezing, one cache slot
+            args = None
+            log.info("MCP stdio call_tool: %s", name)
+            cache_key = (name,) if name in _CACHEABLE_TOOLS else None
         else:
+            args = arguments if arguments is not None else _EMPTY_ARGS
+            if log.isEnabledFor(logging.INFO):
+                log.info("MCP stdio call_tool: %s with args: %s", name, list(args))
+            cache_key = (name, _freeze(args)) if name in _CACHEABLE_TOOLS else None
+        if cache_key is not None:
+            # Rule packs may have been written by another process (HTTP bridge,
+            # seeding); the check is a DB read at most once per TTL, off the loop
+            await _sync_rulepack_epoch_async()
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+                log.info("MCP stdio call_tool: %s served from cache", name)
+                return [TextContent(type="text", text=cached)]
+
+        # Route to appropriate handler function (see HANDLERS below)
+        fn = HANDLERS.get(name)
+        if fn is None:
             raise ValueError(f"Unknown tool: {name}")
+        if args is None:
+            result = await fn()
+        else:
+            missing = [k for k in _REQUIRED_ARGS.get(name, ()) if k not in args]
+            if missing:
+                raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+            result = await fn(args)
 
         # Format result as TextContent
         # For analyze_document, return markdown directly for better LibreChat display
@@ -277,25 +435,65 @@ async def call_tool(name: str, arguments: Dict[str, Any] | None = None) -> List[
             summary += "---\n\n"
             result_text = summary + markdown
         else:
-            result_text = json.dumps(result, indent=2, default=str)
+            result_text = _dumps(result)
 
-        log.info(f"MCP stdio call_tool: {name} completed successfully")
+        if cache_key is not None:
+            _RESULT_CACHE[cache_key] = result_text
+            if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+
+        log.info("MCP stdio call_tool: %s completed successfully", name)
         return [TextContent(type="text", text=result_text)]
 
+    except ValueError as e:
+        # Expected client errors (unknown tool, missing args, pack not found): message only
+        error_msg = f"Tool '{name}' failed: {e}"
+        log.warning(error_msg)
+        return [TextContent(type="text", text=_dumps({"error": error_msg}))]
     except Exception as e:
         error_msg = f"Tool '{name}' failed: {str(e)}"
-        log.error(error_msg)
-        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+        log.exception(error_msg)
+        return [TextContent(type="text", text=_dumps({"error": error_msg}))]
 
 # ========================================
 # TOOL HANDLER FUNCTIONS
 # ========================================
 
+@functools.lru_cache(maxsize=1)
+def _analysis_pool() -> Optional[ProcessPoolExecutor]:
+    """Process pool for CPU-bound analysis, created on first use (CE_ANALYSIS_PROCESSES > 0)."""
+    if settings.CE_ANALYSIS_PROCESSES <= 0:
+        return None
+    pool = ProcessPoolExecutor(max_workers=settings.CE_ANALYSIS_PROCESSES)
+    atexit.register(pool.shutdown)
+    return pool
+
+async def _run_cpu_bound(fn, *args, **kwargs):
+    """
+    Run fn off the event loop: in the analysis process pool when enabled (so
+    concurrent analyses aren't serialized by the GIL), else in a worker thread.
+    """
+    pool = _analysis_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+
+# Columns the list tools return; the YAML/JSON payload columns are never fetched
+_PACK_LISTING_COLUMNS = (
+    RulePackRecord.id,
+    RulePackRecord.version,
+    RulePackRecord.status,
+    RulePackRecord.doc_type_names,
+    RulePackRecord.notes,
+)
+
 async def handle_list_all_rulepacks() -> List[Dict[str, Any]]:
     """List ALL rule packs in the database (any status/version)."""
     with SessionLocal() as db:
-        rows = db.query(RulePackRecord).order_by(
-            RulePackRecord.id.asc(), RulePackRecord.version.asc()
+        rows = db.execute(
+            select(*_PACK_LISTING_COLUMNS, RulePackRecord.created_by)
+            .order_by(RulePackRecord.id.asc(), RulePackRecord.version.asc())
         ).all()
 
         result = []
@@ -304,7 +502,7 @@ async def handle_list_all_rulepacks() -> List[Dict[str, Any]]:
                 "id": r.id,
                 "version": r.version,
                 "status": r.status,
-                "doc_type_names": list(r.doc_type_names or []),
+                "doc_type_names": r.doc_type_names or (),
                 "created_by": r.created_by,
                 "notes": r.notes or ""
             })
@@ -315,32 +513,58 @@ async def handle_list_all_rulepacks() -> List[Dict[str, Any]]:
 async def handle_list_active_rulepacks() -> List[Dict[str, Any]]:
     """List only active rule packs (for runtime evaluation)."""
     with SessionLocal() as db:
-        packs_dict = load_packs_for_runtime(db)
+        packs_dict = _runtime_packs(db)
         result = []
         for pack_id, pack in packs_dict.items():
             version = getattr(pack, 'version', 1)
             result.append({
                 "id": pack_id,
                 "version": int(version),
-                "doc_type_names": list(getattr(pack, 'doc_type_names', []))
+                "doc_type_names": getattr(pack, "doc_type_names", None) or ()
             })
         log.info(f"MCP list_active_rulepacks: found {len(result)} active packs")
         return result
 
+def _fetch_pack(db, pack_id: str, version: Optional[int]) -> Optional[RulePackRecord]:
+    """
+    One rule pack record: the given version, or the latest when version is None.
+
+    A specific version is a primary-key get (served from the session identity
+    map when already loaded); "latest" runs a cached lambda statement, so its
+    SQL is compiled once per process rather than per call.
+    """
+    if version is not None:
+        return db.get(RulePackRecord, {"id": pack_id, "version": version})
+    stmt = lambda_stmt(lambda: select(RulePackRecord).where(RulePackRecord.id == pack_id))
+    stmt += lambda s: s.order_by(RulePackRecord.version.desc()).limit(1)
+    return db.execute(stmt).scalars().first()
+
+def _require_pack(db, pack_id: str, version: int) -> RulePackRecord:
+    """The pack_id@version record, or ValueError if it doesn't exist."""
+    rec = db.get(RulePackRecord, {"id": pack_id, "version": version})
+    if rec is None:
+        raise ValueError(f"Rule pack {pack_id}@{version} not found")
+    return rec
+
+def _require_pack_status(db, pack_id: str, version: int) -> str:
+    """Status of pack_id@version without loading the row, or ValueError if it doesn't exist."""
+    stmt = lambda_stmt(
+        lambda: select(RulePackRecord.status).where(
+            RulePackRecord.id == pack_id, RulePackRecord.version == version
+        )
+    )
+    status = db.execute(stmt).scalar_one_or_none()
+    if status is None:
+        raise ValueError(f"Rule pack {pack_id}@{version} not found")
+    return status
+
 async def handle_get_rulepack_details(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get detailed information for a specific rule pack version."""
     pack_id = args["pack_id"]
     version = args.get("version")
 
     with SessionLocal() as db:
-        query = db.query(RulePackRecord).filter(RulePackRecord.id == pack_id)
-
-        if version is not None:
-            query = query.filter(RulePackRecord.version == version)
-        else:
-            query = query.order_by(RulePackRecord.version.desc())
-
-        rec = query.first()
+        rec = _fetch_pack(db, pack_id, version)
 
         if rec is None:
             raise ValueError(f"Rule pack '{pack_id}' not found")
@@ -350,7 +574,7 @@ async def handle_get_rulepack_details(args: Dict[str, Any]) -> Dict[str, Any]:
             "version": rec.version,
             "status": rec.status,
             "schema_version": rec.schema_version,
-            "doc_type_names": list(rec.doc_type_names or []),
+            "doc_type_names": rec.doc_type_names or (),
             "rules": rec.ruleset_json or {},
             "rules_json": list(rec.rules_json or []),
             "llm_prompt": rec.llm_prompt or "",
@@ -371,14 +595,7 @@ async def handle_get_rulepack_yaml(args: Dict[str, Any]) -> str:
     version = args.get("version")
 
     with SessionLocal() as db:
-        query = db.query(RulePackRecord).filter(RulePackRecord.id == pack_id)
-
-        if version is not None:
-            query = query.filter(RulePackRecord.version == version)
-        else:
-            query = query.order_by(RulePackRecord.version.desc())
-
-        rec = query.first()
+        rec = _fetch_pack(db, pack_id, version)
 
         if rec is None:
             raise ValueError(f"Rule pack '{pack_id}' not found")
@@ -392,12 +609,11 @@ async def handle_list_rulepack_versions(args: Dict[str, Any]) -> List[Dict[str,
     pack_id = args["pack_id"]
 
     with SessionLocal() as db:
-        rows = (
-            db.query(RulePackRecord)
-            .filter(RulePackRecord.id == pack_id)
+        rows = db.execute(
+            select(*_PACK_LISTING_COLUMNS)
+            .where(RulePackRecord.id == pack_id)
             .order_by(RulePackRecord.version.asc())
-            .all()
-        )
+        ).all()
 
         if not rows:
             raise ValueError(f"No rule pack found with id '{pack_id}'")
@@ -408,7 +624,7 @@ async def handle_list_rulepack_versions(args: Dict[str, Any]) -> List[Dict[str,
                 "id": r.id,
                 "version": r.version,
                 "status": r.status,
-                "doc_type_names": list(r.doc_type_names or []),
+                "doc_type_names": r.doc_type_names or (),
                 "notes": r.notes or ""
             })
 
@@ -420,10 +636,19 @@ async def handle_create_rulepack_from_yaml(args: Dict[str, Any]) -> Dict[str, An
     yaml_content = args["yaml_content"]
     created_by = args.get("created_by", "mcp-llm")
 
+    # YAML parse, validation and the insert block; keep them off the event loop
+    result = await asyncio.to_thread(_create_rulepack_sync, yaml_content, created_by)
+
+    _invalidate_rulepack_caches()
+    log.info(f"MCP create_rulepack_from_yaml: created {result['id']}@{result['version']}")
+    return result
+
+def _create_rulepack_sync(yaml_content: str, created_by: str) -> Dict[str, Any]:
+    """Body of create_rulepack_from_yaml (runs in a worker thread)."""
     with SessionLocal() as db:
         draft = import_rulepack_yaml(db, yaml_text=yaml_content, created_by=created_by)
 
-        result = {
+        return {
             "id": draft.id,
             "version": draft.version,
             "status": "draft",
@@ -431,8 +656,19 @@ async def handle_create_rulepack_from_yaml(args: Dict[str, Any]) -> Dict[str, An
             "message": f"Draft rule pack '{draft.id}' created successfully"
         }
 
-        log.info(f"MCP create_rulepack_from_yaml: created {draft.id}@{draft.version}")
-        return result
+# RulePackUpdate field -> (RulePackRecord column, converter); None fields are left alone
+_RULEPACK_UPDATE_FIELDS = (
+    ("schema_version", "schema_version", None),
+    ("doc_type_names", "doc_type_names", list),
+    ("rules", "ruleset_json", lambda rules: rules.model_dump()),
+    ("rules_json", "rules_json", list),
+    ("llm_prompt", "llm_prompt", None),
+    ("examples", "llm_examples_json", lambda examples: [e.model_dump() for e in examples]),
+    ("extensions", "extensions_json", None),
+    ("extensions_schema", "extensions_schema_json", None),
+    ("raw_yaml", "raw_yaml", None),
+    ("notes", "notes", None),
+)
 
 async def handle_update_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
     """Update a draft rule pack with new YAML content."""
@@ -440,23 +676,23 @@ async def handle_update_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
     version = args["version"]
     yaml_content = args["yaml_content"]
 
-    with SessionLocal() as db:
-        rec = (
-            db.query(RulePackRecord)
-            .filter(RulePackRecord.id == pack_id, RulePackRecord.version == version)
-            .one_or_none()
-        )
+    # YAML parse, validation and the update block; keep them off the event loop
+    result = await asyncio.to_thread(_update_rulepack_sync, pack_id, version, yaml_content)
 
-        if rec is None:
-            raise ValueError(f"Rule pack {pack_id}@{version} not found")
+    _invalidate_rulepack_caches()
+    log.info(f"MCP update_rulepack_yaml: updated {pack_id}@{version}")
+    return result
+
+def _update_rulepack_sync(pack_id: str, version: int, yaml_content: str) -> Dict[str, Any]:
+    """Body of update_rulepack_yaml (runs in a worker thread)."""
+    with SessionLocal() as db:
+        rec = _require_pack(db, pack_id, version)
 
         if rec.status != "draft":
             raise ValueError(f"Only draft rule packs can be edited. Current status: {rec.status}")
 
         # Parse and update the rule pack
-        import yaml
-
-        raw = yaml.safe_load(yaml_content) or {}
+        raw = yaml.load(yaml_content, Loader=_YamlLoader) or {}
 
         rules = RuleSet(
             jurisdiction={"allowed_countries": raw.get("jurisdiction_allowlist", [])},
@@ -481,32 +717,15 @@ async def handle_update_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # Apply update
-        if upd.schema_version is not None:
-            rec.schema_version = upd.schema_version
-        if upd.doc_type_names is not None:
-            rec.doc_type_names = list(upd.doc_type_names)
-        if upd.rules is not None:
-            rec.ruleset_json = upd.rules.model_dump()
-        if upd.rules_json is not None:
-            rec.rules_json = list(upd.rules_json)
-        if upd.llm_prompt is not None:
-            rec.llm_prompt = upd.llm_prompt
-        if upd.examples is not None:
-            rec.llm_examples_json = [e.model_dump() for e in upd.examples]
-        if upd.extensions is not None:
-            rec.extensions_json = upd.extensions
-        if upd.extensions_schema is not None:
-            rec.extensions_schema_json = upd.extensions_schema
-        if upd.raw_yaml is not None:
-            rec.raw_yaml = upd.raw_yaml
-        if upd.notes is not None:
-            rec.notes = upd.notes
-
-        db.add(rec)
+        for src, dst, convert in _RULEPACK_UPDATE_FIELDS:
+            value = getattr(upd, src)
+            if value is not None:
+                setattr(rec, dst, convert(value) if convert else value)
+
         db.commit()
         db.refresh(rec)
 
-        result = {
+        return {
             "id": rec.id,
             "version": rec.version,
             "status": rec.status,
@@ -514,9 +733,6 @@ async def handle_update_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": f"Rule pack {pack_id}@{version} updated successfully"
         }
 
-        log.info(f"MCP update_rulepack_yaml: updated {pack_id}@{version}")
-        return result
-
 async def handle_publish_rulepack(args: Dict[str, Any]) -> Dict[str, Any]:
     """Publish a draft rule pack to make it active."""
     pack_id = args["pack_id"]
@@ -533,6 +749,7 @@ async def handle_publish_rulepack(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": f"Rule pack {pack_id}@{version} published successfully"
         }
 
+        _invalidate_rulepack_caches()
         log.info(f"MCP publish_rulepack: published {pack_id}@{version}")
         return result
 
@@ -542,38 +759,42 @@ async def handle_deprecate_rulepack(args: Dict[str, Any]) -> Dict[str, Any]:
     version = args["version"]
 
     with SessionLocal() as db:
-        rec = (
-            db.query(RulePackRecord)
-            .filter(RulePackRecord.id == pack_id, RulePackRecord.version == version)
-            .one_or_none()
-        )
+        # One UPDATE for the normal case; only a miss looks at the row
+        updated = db.execute(
+            update(RulePackRecord)
+            .where(
+                RulePackRecord.id == pack_id,
+                RulePackRecord.version == version,
+                RulePackRecord.status.in_(("active", "draft")),
+            )
+            .values(status="deprecated")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        if not updated:
+            status = _require_pack_status(db, pack_id, version)
+
+            if status == "deprecated":
+                result = {
+                    "id": pack_id,
+                    "version": version,
+                    "status": "deprecated",
+                    "message": f"Rule pack {pack_id}@{version} was already deprecated"
+                }
+                return result
+
+            raise ValueError(f"Cannot deprecate rule pack with status '{status}'")
 
-        if rec is None:
-            raise ValueError(f"Rule pack {pack_id}@{version} not found")
-
-        if rec.status == "deprecated":
-            result = {
-                "id": rec.id,
-                "version": rec.version,
-                "status": "deprecated",
-                "message": f"Rule pack {pack_id}@{version} was already deprecated"
-            }
-            return result
-
-        if rec.status not in ("active", "draft"):
-            raise ValueError(f"Cannot deprecate rule pack with status '{rec.status}'")
-
-        rec.status = "deprecated"
-        db.add(rec)
         db.commit()
 
         result = {
-            "id": rec.id,
-            "version": rec.version,
+            "id": pack_id,
+            "version": version,
             "status": "deprecated",
             "message": f"Rule pack {pack_id}@{version} deprecated successfully"
         }
 
+        _invalidate_rulepack_caches()
         log.info(f"MCP deprecate_rulepack: deprecated {pack_id}@{version}")
         return result
 
@@ -584,22 +805,22 @@ async def handle_delete_rulepack(args: Dict[str, Any]) -> Dict[str, Any]:
     force = args.get("force", False)
 
     with SessionLocal() as db:
-        rec = (
-            db.query(RulePackRecord)
-            .filter(RulePackRecord.id == pack_id, RulePackRecord.version == version)
-            .one_or_none()
+        # One DELETE for the normal case; only a miss looks at the row
+        stmt = delete(RulePackRecord).where(
+            RulePackRecord.id == pack_id, RulePackRecord.version == version
         )
+        if not force:
+            stmt = stmt.where(RulePackRecord.status == "draft")
+        deleted = db.execute(stmt.execution_options(synchronize_session=False)).rowcount
 
-        if rec is None:
-            raise ValueError(f"Rule pack {pack_id}@{version} not found")
+        if not deleted:
+            status = _require_pack_status(db, pack_id, version)
 
-        if rec.status != "draft" and not force:
             raise ValueError(
-                f"Cannot delete {rec.status} pack without force=True. "
+                f"Cannot delete {status} pack without force=True. "
                 f"Consider deprecating it instead, or use force=True if deletion is really needed."
             )
 
-        db.delete(rec)
         db.commit()
 
         result = {
@@ -609,16 +830,22 @@ async def handle_delete_rulepack(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": f"Rule pack {pack_id}@{version} deleted successfully"
         }
 
+        _invalidate_rulepack_caches()
         log.info(f"MCP delete_rulepack: deleted {pack_id}@{version}")
         return result
 
+# Uploads with these suffixes are read as UTF-8 text; everything else goes to the PDF parser
+_PLAIN_TEXT_SUFFIXES = frozenset({".txt", ".md"})
+
 async def handle_analyze_document(args: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze a contract document using rule packs."""
 
     # DEBUG: Log incoming arguments to track file uploads
     log.info("=" * 60)
     log.info("ANALYZE_DOCUMENT TOOL CALLED")
-    log.info(f"Args received: {json.dumps(args, indent=2, default=str)}")
+    # document_text is summarized by length below; echoing it would put a
+    # second (escaped) copy of the whole document in memory and in the log
+    log.info("Args received: %s", {k: v for k, v in args.items() if k != "document_text"})
     log.info(f"  document_path: {args.get('document_path')}")
     log.info(f"  document_text length: {len(args.get('document_text', '')) if args.get('document_text') else 0}")
     log.info(f"  doc_type_hint: {args.get('doc_type_hint')}")
@@ -640,9 +867,17 @@ async def handle_analyze_document(args: Dict[str, Any]) -> Dict[str, Any]:
         if not path_obj.exists():
             raise ValueError(f"Document path does not exist: {document_path}")
 
-        with open(path_obj, 'rb') as f:
-            raw_bytes = f.read()
-        text = ingest_bytes_to_text(raw_bytes, filename=path_obj.name)
+        if path_obj.suffix.lower() in _PLAIN_TEXT_SUFFIXES:
+            # Already text: no PDF parser involved
+            text = await asyncio.to_thread(path_obj.read_text, encoding="utf-8", errors="replace")
+        else:
+            # PDF parsing is CPU-bound; run it off the event loop. The parser opens
+            # the file itself, so the whole PDF is never held (or pickled to a
+            # worker process) as one bytes object, and the text cache is keyed by
+            # path/mtime/size instead of hashing the file contents. PyMuPDF is not
+            # thread-safe; on the thread path document_analysis serializes it
+            # behind _FITZ_LOCK, and CE_ANALYSIS_PROCESSES > 0 parses in processes.
+            text = await _run_cpu_bound(extract_text_with_pages, str(path_obj))
 
         # BUGFIX: Use source_filename if provided (original name), else fall back to temp path stem
         if source_filename:
@@ -659,112 +894,116 @@ async def handle_analyze_document(args: Dict[str, Any]) -> Dict[str, Any]:
 
     # Initialize DB and load packs
     init_db()
+    # The session only covers the pack lookup: it is closed before any await,
+    # so no pooled connection is held while the report is built
     with SessionLocal() as db:
-        packs_dict = load_packs_for_runtime(db)
-
-        if not packs_dict:
-            raise ValueError("No active rule packs available")
-
-        # Choose pack (enhanced selection logic)
-        selected_pack = None
-        selected_pack_id = None
-
-        if pack_id_hint and pack_id_hint in packs_dict:
-            # Use explicitly specified pack
-            selected_pack = packs_dict[pack_id_hint]
-            selected_pack_id = pack_id_hint
-        elif doc_type_hint and doc_type_hint in packs_dict:
-            # Use doc type hint
-            selected_pack = packs_dict[doc_type_hint]
-            selected_pack_id = doc_type_hint
+        # A valid hint narrows to its own pack; otherwise every active pack (cached per epoch)
+        packs_dict = _runtime_packs(db, (pack_id_hint, doc_type_hint))
+
+    if not packs_dict:
+        raise ValueError("No active rule packs available")
+
+    # Choose pack (enhanced selection logic)
+    selected_pack = None
+    selected_pack_id = None
+
+    if pack_id_hint and pack_id_hint in packs_dict:
+        # Use explicitly specified pack
+        selected_pack = packs_dict[pack_id_hint]
+        selected_pack_id = pack_id_hint
+    elif doc_type_hint and doc_type_hint in packs_dict:
+        # Use doc type hint
+        selected_pack = packs_dict[doc_type_hint]
+        selected_pack_id = doc_type_hint
+    else:
+        # Use guess or fallback to first pack
+        guessed_id = _guess_doc_type(text, packs_dict)
+        if guessed_id:
+            selected_pack = packs_dict[guessed_id]
+            selected_pack_id = guessed_id
         else:
-            # Use guess or fallback to first pack
-            guessed_id = guess_doc_type_id(text, packs_dict)
-            if guessed_id:
-                selected_pack = packs_dict[guessed_id]
-                selected_pack_id = guessed_id
-            else:
-                # Fallback to first available pack
-                selected_pack_id = next(iter(packs_dict.keys()))
-                selected_pack = packs_dict[selected_pack_id]
-
-        # Create safe output directory
-        doc_hash = hashlib.md5(document_name.encode()).hexdigest()[:8]
-        out_dir = Path("outputs") / "mcp_stdio" / f"{document_name}_{doc_hash}"
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        # Run standard analysis
-        # BUGFIX (Task 3a): Pass pack_data to enable custom lease rule evaluation
-        report = make_report(
-            document_name=document_name,
-            text=text,
-            rules=selected_pack.rules,
-            pack_data=selected_pack  # Contains rules_json for custom lease rules
-        )
-
-        # Save artifacts
-        save_markdown(report, out_dir)
-        save_txt(report, out_dir)
-
-        # Read markdown content for LibreChat display
-        markdown_path = out_dir / "report.md"
-        markdown_content = markdown_path.read_text(encoding='utf-8') if markdown_path.exists() else ""
-
-        # Build comprehensive results
-        violations = []
-        findings_summary = []
-
-        for finding in report.findings:
-            finding_summary = {
+            # Fallback to first available pack
+            selected_pack_id = next(iter(packs_dict.keys()))
+            selected_pack = packs_dict[selected_pack_id]
+
+    # Create safe output directory
+    doc_hash = hashlib.blake2b(document_name.encode(), digest_size=4).hexdigest()
+    out_dir = Path("outputs") / "mcp_stdio" / f"{document_name}_{doc_hash}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Run standard analysis
+    # BUGFIX (Task 3a): Pass pack_data to enable custom lease rule evaluation
+    # make_report blocks on rule evaluation and LLM HTTP calls, so it runs off
+    # the event loop to keep the server responsive to concurrent requests
+    report = await _run_cpu_bound(
+        make_report,
+        document_name=document_name,
+        text=text,
+        rules=selected_pack.rules,
+        pack_data=selected_pack  # Contains rules_json for custom lease rules
+    )
+
+    # Save artifacts; the Markdown written is also returned for LibreChat display
+    markdown_content = await asyncio.to_thread(save_markdown, report, out_dir)
+    await asyncio.to_thread(save_txt, report, out_dir)
+
+    # Build comprehensive results
+    violations = []
+    findings_summary = []
+
+    for finding in report.findings:
+        finding_summary = {
+            "rule_id": finding.rule_id,
+            "passed": finding.passed,
+            "details": finding.details
+        }
+        findings_summary.append(finding_summary)
+
+        if not finding.passed:
+            citations = [
+                {
+                    "quote": _truncate_quote(citation.quote, 200),
+                    "char_start": citation.char_start,
+                    "char_end": citation.char_end,
+                }
+                for citation in finding.citations or ()
+            ]
+            excerpt = citations[0]["quote"] if citations else ""
+
+            violations.append({
                 "rule_id": finding.rule_id,
-                "passed": finding.passed,
+                "excerpt": excerpt,
+                "citations": citations,
                 "details": finding.details
-            }
-            findings_summary.append(finding_summary)
-
-            if not finding.passed:
-                excerpt = ""
-                citations = []
-
-                if hasattr(finding, 'citations') and finding.citations:
-                    for citation in finding.citations:
-                        quote = (citation.quote or "").strip()
-                        if len(quote) > 200:
-                            quote = quote[:200] + "..."
-                        citations.append({
-                            "quote": quote,
-                            "char_start": getattr(citation, 'char_start', None),
-                            "char_end": getattr(citation, 'char_end', None)
-                        })
-
-                    if citations:
-                        excerpt = citations[0]["quote"]
-
-                violations.append({
-                    "rule_id": finding.rule_id,
-                    "excerpt": excerpt,
-                    "citations": citations,
-                    "details": finding.details
-                })
+            })
 
-        result = {
-            "document_name": document_name,
-            "doc_type": selected_pack_id,
-            "pack_version": getattr(selected_pack, 'version', 1),
-            "overall_result": "PASS" if report.passed_all else "FAIL",
-            "violations": violations,
-            "findings_summary": findings_summary,
-            "violation_count": len(violations),
-            "total_findings": len(findings_summary),
-            "markdown_report": markdown_content,
-            "output_files": {
-                "markdown_report": str(out_dir / "report.md"),
-                "text_report": str(out_dir / "report.txt")
-            }
+    result = {
+        "document_name": document_name,
+        "doc_type": selected_pack_id,
+        "pack_version": getattr(selected_pack, 'version', 1),
+        "overall_result": "PASS" if report.passed_all else "FAIL",
+        "violations": violations,
+        "findings_summary": findings_summary,
+        "violation_count": len(violations),
+        "total_findings": len(findings_summary),
+        "markdown_report": markdown_content,
+        "output_files": {
+            "markdown_report": str(out_dir / "report.md"),
+            "text_report": str(out_dir / "report.txt")
         }
+    }
 
-        log.info(f"MCP analyze_document: processed {document_name}, result: {result['overall_result']}, violations: {len(violations)}")
-        return result
+    log.info(f"MCP analyze_document: processed {document_name}, result: {result['overall_result']}, violations: {len(violations)}")
+    return result
+
+def _truncate_quote(quote: Optional[str], limit: int) -> str:
+    """Stripped citation quote, cut to limit chars with a trailing ellipsis."""
+    quote = (quote or "").strip()
+    return quote[:limit] + "..." if len(quote) > limit else quote
+
+def _preview_excerpt(citations) -> str:
+    """First citation quote, trimmed to 100 chars for preview payloads."""
+    return _truncate_quote(citations[0].quote, 100) if citations else ""
 
 async def handle_preview_document_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     """Quick preview analysis without saving files."""
@@ -773,67 +1012,60 @@ async def handle_preview_document_analysis(args: Dict[str, Any]) -> Dict[str, An
 
     # Initialize DB and load packs
     init_db()
-    with SessionLocal() as db:
-        packs_dict = load_packs_for_runtime(db)
-
-        if not packs_dict:
-            raise ValueError("No active rule packs available")
-
-        # Choose pack
-        selected_pack_id = pack_id
-        if not selected_pack_id or selected_pack_id not in packs_dict:
-            guessed_id = guess_doc_type_id(document_text, packs_dict)
-            selected_pack_id = guessed_id or next(iter(packs_dict.keys()))
-
-        selected_pack = packs_dict[selected_pack_id]
-
-        # Run analysis
-        # BUGFIX (Task 3a): Pass pack_data to enable custom lease rule evaluation
-        report = make_report(
-            document_name="preview",
-            text=document_text,
-            rules=selected_pack.rules,
-            pack_data=selected_pack  # Contains rules_json for custom lease rules
-        )
-
-        # Build summary results
-        violations = []
-        for finding in report.findings:
-            if not finding.passed:
-                excerpt = ""
-                if hasattr(finding, 'citations') and finding.citations:
-                    first_citation = finding.citations[0]
-                    excerpt = (first_citation.quote or "").strip()
-                    if len(excerpt) > 100:
-                        excerpt = excerpt[:100] + "..."
-
-                violations.append({
-                    "rule_id": finding.rule_id,
-                    "excerpt": excerpt,
-                    "details": finding.details
-                })
-
-        result = {
-            "pack_used": selected_pack_id,
-            "overall_result": "PASS" if report.passed_all else "FAIL",
-            "violation_count": len(violations),
-            "violations": violations,
-            "total_findings_checked": len(report.findings)
+    with SessionLocal() as db:  # closed before the report is built (see handle_analyze_document)
+        # A valid pack_id narrows to its own pack; otherwise every active pack (cached per epoch)
+        packs_dict = _runtime_packs(db, (pack_id,))
+
+    if not packs_dict:
+        raise ValueError("No active rule packs available")
+
+    # Choose pack
+    selected_pack_id = pack_id
+    if not selected_pack_id or selected_pack_id not in packs_dict:
+        guessed_id = _guess_doc_type(document_text, packs_dict)
+        selected_pack_id = guessed_id or next(iter(packs_dict.keys()))
+
+    selected_pack = packs_dict[selected_pack_id]
+
+    # Run analysis (off the event loop - see handle_analyze_document)
+    # BUGFIX (Task 3a): Pass pack_data to enable custom lease rule evaluation
+    report = await _run_cpu_bound(
+        make_report,
+        document_name="preview",
+        text=document_text,
+        rules=selected_pack.rules,
+        pack_data=selected_pack  # Contains rules_json for custom lease rules
+    )
+
+    # Build summary results in one pass over the findings
+    violations = [
+        {
+            "rule_id": finding.rule_id,
+            "excerpt": _preview_excerpt(finding.citations),
+            "details": finding.details,
         }
+        for finding in report.findings
+        if not finding.passed
+    ]
 
-        log.info(f"MCP preview_document_analysis: {result['overall_result']}, {len(violations)} violations")
-        return result
+    result = {
+        "pack_used": selected_pack_id,
+        "overall_result": "PASS" if report.passed_all else "FAIL",
+        "violation_count": len(violations),
+        "violations": violations,
+        "total_findings_checked": len(report.findings)
+    }
 
-async def handle_generate_rulepack_template(args: Dict[str, Any]) -> str:
-    """Generate a YAML template for creating new rule packs."""
-    pack_id = args["pack_id"]
-    doc_type_names = args["doc_type_names"]
+    log.info(f"MCP preview_document_analysis: {result['overall_result']}, {len(violations)} violations")
+    return result
 
-    template = f"""# Rule Pack Template
+# Body of generate_rulepack_template, prebuilt once; only the id and the
+# doc type list vary per call.
+_RULEPACK_TEMPLATE = """# Rule Pack Template
 id: {pack_id}
 schema_version: "1.0"
 doc_type_names:
-{chr(10).join(f"  - {name}" for name in doc_type_names)}
+{doc_types}
 
 # Jurisdiction rules - specify allowed countries
 jurisdiction_allowlist:
@@ -869,21 +1101,54 @@ prompt: |
 examples: []
 
 # Additional notes
-notes: "Template rule pack for {pack_id}"
+notes: {notes}
 """
 
+# Words, hyphens and single spaces are candidates for plain YAML scalars
+_YAML_PLAIN_RE = re.compile(r"[\w\-]+(?: [\w\-]+)*")
+
+
+def _yaml_plain_roundtrips(value: str) -> bool:
+    """True if value loads back as the same string (not a bool, null or number)."""
+    try:
+        return yaml.load(value, Loader=_YamlLoader) == value
+    except yaml.YAMLError:
+        return False
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render value as a YAML scalar, quoting anything that is not plain-safe."""
+    value = str(value)
+    if _YAML_PLAIN_RE.fullmatch(value) and _yaml_plain_roundtrips(value):
+        return value
+    # A JSON string is a valid double-quoted YAML scalar
+    return json.dumps(value)
+
+
+async def handle_generate_rulepack_template(args: Dict[str, Any]) -> str:
+    """Generate a YAML template for creating new rule packs."""
+    pack_id = args["pack_id"]
+    doc_type_names = args["doc_type_names"]
+
+    template = _RULEPACK_TEMPLATE.format(
+        pack_id=_yaml_scalar(pack_id),
+        doc_types="\n".join(f"  - {_yaml_scalar(name)}" for name in doc_type_names),
+        notes=json.dumps(f"Template rule pack for {pack_id}"),
+    )
+
     log.info(f"MCP generate_rulepack_template: generated template for {pack_id}")
     return template
 
 async def handle_validate_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
     """Validate YAML content before creating/updating rule packs."""
-    yaml_content = args["yaml_content"]
-
-    import yaml
+    # Parsing a large pack blocks; keep it off the event loop
+    return await asyncio.to_thread(_validate_rulepack_yaml_sync, args["yaml_content"])
 
+def _validate_rulepack_yaml_sync(yaml_content: str) -> Dict[str, Any]:
+    """Body of validate_rulepack_yaml (runs in a worker thread)."""
     # Parse YAML
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         return {
             "valid": False,
@@ -947,28 +1212,56 @@ async def handle_validate_rulepack_yaml(args: Dict[str, Any]) -> Dict[str, Any]:
     log.info(f"MCP validate_rulepack_yaml: validation successful for {data['id']}")
     return result
 
+def _count_rulepacks_by_status() -> tuple:
+    """(total, active, draft, deprecated) rule pack counts."""
+    # One GROUP BY scan instead of four COUNT(*) round trips
+    with SessionLocal() as db:
+        counts = dict(db.execute(
+            select(RulePackRecord.status, func.count()).group_by(RulePackRecord.status)
+        ).all())
+    return (
+        sum(counts.values()),
+        counts.get("active", 0),
+        counts.get("draft", 0),
+        counts.get("deprecated", 0),
+    )
+
+def _directory_size(path: Path) -> int:
+    """Total size in bytes of all files under path (0 if it doesn't exist)."""
+    # scandir walk: entry types come from the directory read, so only regular
+    # files cost a stat() and no Path objects are built per entry
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except (FileNotFoundError, NotADirectoryError):
+            continue  # root missing, or a report dir removed mid-walk
+    return total
+
 async def handle_get_system_info() -> Dict[str, Any]:
     """Get system information for debugging and monitoring."""
 
     # DEBUG: Log database connection info
-    import os
-    from infrastructure import settings, DATABASE_URL
     log.info(f"DEBUG: Current working directory: {os.getcwd()}")
     log.info(f"DEBUG: Database URL being used: {DATABASE_URL}")
     log.info(f"DEBUG: Settings DATABASE_URL: {settings.DATABASE_URL}")
     log.info(f"DEBUG: DATABASE_URL env var: {os.getenv('DATABASE_URL', 'NOT SET')}")
 
-    with SessionLocal() as db:
-        total_packs = db.query(RulePackRecord).count()
-        active_packs = db.query(RulePackRecord).filter(RulePackRecord.status == "active").count()
-        draft_packs = db.query(RulePackRecord).filter(RulePackRecord.status == "draft").count()
-        deprecated_packs = db.query(RulePackRecord).filter(RulePackRecord.status == "deprecated").count()
-
-        # DEBUG: Log query results
-        log.info(f"DEBUG: Query results - total:{total_packs}, active:{active_packs}, draft:{draft_packs}, deprecated:{deprecated_packs}")
-
+    # The DB counts and the outputs/ walk are independent: run them concurrently
     outputs_dir = Path("outputs")
-    outputs_size = sum(f.stat().st_size for f in outputs_dir.rglob('*') if f.is_file()) if outputs_dir.exists() else 0
+    (total_packs, active_packs, draft_packs, deprecated_packs), outputs_size = await asyncio.gather(
+        asyncio.to_thread(_count_rulepacks_by_status),
+        asyncio.to_thread(_directory_size, outputs_dir),
+    )
+
+    # DEBUG: Log query results
+    log.info(f"DEBUG: Query results - total:{total_packs}, active:{active_packs}, draft:{draft_packs}, deprecated:{deprecated_packs}")
 
     result = {
         "database": {
@@ -994,6 +1287,36 @@ async def handle_get_system_info() -> Dict[str, Any]:
     log.info("MCP get_system_info: retrieved system information")
     return result
 
+# ========================================
+# TOOL DISPATCH TABLE
+# ========================================
+
+# tool name -> handler; built once so call_tool is a single lookup
+HANDLERS = {
+    "list_all_rulepacks": handle_list_all_rulepacks,
+    "list_active_rulepacks": handle_list_active_rulepacks,
+    "get_rulepack_details": handle_get_rulepack_details,
+    "get_rulepack_yaml": handle_get_rulepack_yaml,
+    "list_rulepack_versions": handle_list_rulepack_versions,
+    "create_rulepack_from_yaml": handle_create_rulepack_from_yaml,
+    "update_rulepack_yaml": handle_update_rulepack_yaml,
+    "publish_rulepack": handle_publish_rulepack,
+    "deprecate_rulepack": handle_deprecate_rulepack,
+    "delete_rulepack": handle_delete_rulepack,
+    "analyze_document": handle_analyze_document,
+    "preview_document_analysis": handle_preview_document_analysis,
+    "generate_rulepack_template": handle_generate_rulepack_template,
+    "validate_rulepack_yaml": handle_validate_rulepack_yaml,
+    "get_system_info": handle_get_system_info,
+}
+
+# Tools whose handlers take no arguments; call_tool skips argument handling
+_NOARG_TOOLS = frozenset({
+    "list_all_rulepacks",
+    "list_active_rulepacks",
+    "get_system_info",
+})
+
 # ========================================
 # MAIN ASYNC ENTRY POINT
 # ========================================
@@ -1009,12 +1332,15 @@ async def main():
         log.info("Database initialized successfully")
 
         # Log report version configuration
-        from infrastructure import settings
         log.info(f"Report Version: V2 Renderer = {settings.USE_REPORT_V2}")
         if settings.USE_REPORT_V2:
             log.info("Using new 8-section markdown template with enhanced metadata")
         else:
             log.info("Using legacy markdown renderer")
+
+        # Load active packs now so the first analyze/list call doesn't pay for it
+        with SessionLocal() as db:
+            log.info(f"Preloaded {len(_runtime_packs(db))} active rule packs")
     except Exception as e:
         log.error(f"Database initialization failed: {e}")
         # Continue anyway - some operations may still work
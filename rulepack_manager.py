@@ -10,7 +10,10 @@ Merged from:
 - yaml_importer.py: YAML import/export logic
 """
 
+import os
+import sys
 import yaml
+from functools import lru_cache
 from typing import List, Optional, Any, Dict, Literal
 from sqlalchemy import (
     Column, String, Integer, Text, Enum, TIMESTAMP, text, func,
@@ -18,10 +21,19 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, Session
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator
 
 from infrastructure import Base, RuleSet, ExampleItem, RulePack as RuntimeRulePack
 
+# Built once at import: validates a whole examples list in one pydantic-core call
+_EXAMPLES_ADAPTER = TypeAdapter(List[ExampleItem])
+
+# LibYAML-backed safe loader/dumper when PyYAML was built with it (same semantics, C code)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 # ========================================
 # DATABASE MODELS
 # ========================================
@@ -144,7 +156,7 @@ def _to_read(r: RulePackRecord) -> RulePackRead:
     examples = []
     if r.llm_examples_json:
         try:
-            examples = [ExampleItem.parse_obj(x) for x in r.llm_examples_json]
+            examples = _EXAMPLES_ADAPTER.validate_python(r.llm_examples_json)
         except Exception:
             # Skip malformed examples (common in legacy v1.0 rulepacks)
             examples = []
@@ -155,7 +167,7 @@ def _to_read(r: RulePackRecord) -> RulePackRead:
         status=r.status,
         schema_version=r.schema_version,
         doc_type_names=list(r.doc_type_names or []),
-        rules=RuleSet.parse_obj(r.ruleset_json or {}),
+        rules=RuleSet.model_validate(r.ruleset_json or {}),
         rules_json=list(r.rules_json or []),
         llm_prompt=r.llm_prompt,
         examples=examples,
@@ -184,7 +196,9 @@ def _to_runtime(r: RulePackRecord) -> RuntimeRulePack:
         if 'extractions' in ex_copy:
             fixed_extractions = []
             for extraction in ex_copy['extractions']:
-                ext_copy = dict(extraction)
+                # Interned keys: ExampleExtraction allows extra fields, and every
+                # pack load would otherwise carry fresh copies of the same names
+                ext_copy = {sys.intern(k): v for k, v in extraction.items()}
                 # BUGFIX: Add extraction_text from span for LangExtract compatibility
                 if 'span' in ext_copy and 'extraction_text' not in ext_copy:
                     ext_copy['extraction_text'] = ext_copy['span']
@@ -195,12 +209,13 @@ def _to_runtime(r: RulePackRecord) -> RuntimeRulePack:
             ex_copy['extractions'] = fixed_extractions
         transformed_examples.append(ex_copy)
 
-    return RuntimeRulePack(
+    # rules/examples are validated here; the outer model doesn't need a second pass
+    return RuntimeRulePack.model_construct(
         id=r.id,
         doc_type_names=list(r.doc_type_names or []),
-        rules=RuleSet.parse_obj(r.ruleset_json or {}),
+        rules=RuleSet.model_validate(r.ruleset_json or {}),
         prompt=r.llm_prompt or "",
-        examples=[ExampleItem.parse_obj(x) for x in transformed_examples],
+        examples=_EXAMPLES_ADAPTER.validate_python(transformed_examples),
         rules_json=list(r.rules_json or []),  # BUGFIX (Task 3a): Include custom lease rules
     )
 
@@ -342,6 +357,23 @@ def load_active_rulepacks(db: Session) -> List[RuntimeRulePack]:
     return [_to_runtime(r) for r in rows]
 
 
+@lru_cache(maxsize=64)
+def _parse_pack_yaml(raw_yaml: str) -> Any:
+    """
+    Parse stored rulepack YAML once per distinct text.
+
+    The parsed dict is shared between callers - treat it as read-only.
+    """
+    return yaml.load(raw_yaml, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_file(file_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; (mtime_ns, size) in the cache key drops stale entries on edit."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_active_v2_rulepacks_from_db(db: Session) -> Dict[str, Dict]:
     """
     Load active v2.0 rulepacks from database in same format as load_all_v2_rulepacks().
@@ -349,8 +381,6 @@ def load_active_v2_rulepacks_from_db(db: Session) -> Dict[str, Dict]:
     Returns:
         Dict mapping rulepack_id to full rulepack data (YAML structure)
     """
-    import yaml
-
     q = select(RulePackRecord).where(
         RulePackRecord.status == "active",
         RulePackRecord.schema_version == "2.0"
@@ -362,7 +392,7 @@ def load_active_v2_rulepacks_from_db(db: Session) -> Dict[str, Dict]:
         # If raw_yaml is stored, use it (most accurate)
         if r.raw_yaml:
             try:
-                rulepack_data = yaml.safe_load(r.raw_yaml)
+                rulepack_data = _parse_pack_yaml(r.raw_yaml)
                 rulepacks[r.id] = rulepack_data
                 continue
             except Exception:
@@ -433,7 +463,7 @@ def import_rulepack_yaml(db: Session, yaml_text: str, created_by: str | None = N
     Returns:
         Created draft rule pack
     """
-    raw = yaml.safe_load(yaml_text) or {}
+    raw = yaml.load(yaml_text, Loader=_YamlLoader) or {}
     schema_version = raw.get("schema_version", "1.0")
 
     # Handle v2.0 schema (Phase 2 rulepacks)
@@ -480,7 +510,7 @@ def import_rulepack_yaml(db: Session, yaml_text: str, created_by: str | None = N
         examples = []
         if examples_yaml:
             try:
-                examples = [ExampleItem.parse_obj(e) for e in examples_yaml]
+                examples = _EXAMPLES_ADAPTER.validate_python(examples_yaml)
             except Exception as e:
                 # Skip malformed examples, just log and continue
                 import logging
@@ -550,7 +580,7 @@ def export_rulepack_to_yaml(db: Session, pack_id: str, version: Optional[int] =
     if pack.notes:
         yaml_data["notes"] = pack.notes
 
-    return yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(yaml_data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
 
 # ========================================
@@ -568,7 +598,7 @@ def validate_rulepack_structure(yaml_text: str) -> Dict[str, Any]:
         Validation result with success status and any errors
     """
     try:
-        data = yaml.safe_load(yaml_text)
+        data = yaml.load(yaml_text, Loader=_YamlLoader)
         if not data:
             return {"valid": False, "error": "Empty YAML content"}
 
@@ -620,12 +650,11 @@ def load_rulepack_v2_from_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         ValueError: If schema_version is not "2.0"
     """
-    import os
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Rulepack file not found: {file_path}")
 
     with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     if not data:
         raise ValueError(f"Empty YAML file: {file_path}")
@@ -653,7 +682,6 @@ def load_all_v2_rulepacks(directory: str = "rules_packs") -> Dict[str, Dict[str,
     Returns:
         Dictionary mapping rulepack_id -> rulepack_data
     """
-    import os
     import glob
 
     rulepacks = {}
@@ -661,7 +689,8 @@ def load_all_v2_rulepacks(directory: str = "rules_packs") -> Dict[str, Dict[str,
 
     for file_path in yaml_files:
         try:
-            data = yaml.safe_load(open(file_path, 'r', encoding='utf-8'))
+            st = os.stat(file_path)
+            data = _load_yaml_file(file_path, st.st_mtime_ns, st.st_size)
             if data and data.get("schema_version") == "2.0":
                 rulepack_id = data.get("id")
                 if rulepack_id: